@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from sprout.cli import Manifest, ManifestContext, execute_manifest
-from sprout.extensions import CurrentYearExtension, GitDefaultsExtension, build_environment
+import importlib
+from typing import TYPE_CHECKING
+
 from sprout.project.actions import (
     GitPostActionResult,
     ProjectPostActionOptions,
@@ -30,13 +31,6 @@ from sprout.project.licenses import (
     render_license_text,
     should_skip_license_file,
 )
-from sprout.prompt import (
-    ask_question,
-    collect_answers,
-    confirm_overwrite,
-    console,
-    supports_live_interaction,
-)
 from sprout.question import YES_NO_CHOICES, Question, parse_yes_no
 from sprout.style import ErrorStyle, InlineStyle, MenuStyle, PromptStyle, Style, SummaryStyle
 from sprout.validators import (
@@ -52,6 +46,45 @@ from sprout.validators import (
     validate_semver,
 )
 
+if TYPE_CHECKING:
+    from sprout.cli import Manifest, ManifestContext, execute_manifest
+    from sprout.extensions import CurrentYearExtension, GitDefaultsExtension, build_environment
+    from sprout.prompt import (
+        ask_question,
+        collect_answers,
+        confirm_overwrite,
+        console,
+        supports_live_interaction,
+    )
+
+# Names backed by Jinja, Rich, or prompt_toolkit are imported on first access so that
+# `import sprout` (and `sprout --help`) does not pay for those import trees up front.
+_LAZY_EXPORTS: dict[str, str] = {
+    "CurrentYearExtension": "sprout.extensions",
+    "GitDefaultsExtension": "sprout.extensions",
+    "Manifest": "sprout.cli",
+    "ManifestContext": "sprout.cli",
+    "ask_question": "sprout.prompt",
+    "build_environment": "sprout.extensions",
+    "collect_answers": "sprout.prompt",
+    "confirm_overwrite": "sprout.prompt",
+    "console": "sprout.prompt",
+    "execute_manifest": "sprout.cli",
+    "supports_live_interaction": "sprout.prompt",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+
+    return value
+
+
 __all__ = [
     "COMMON_LICENSE_CHOICES",
     "NO_LICENSE",
@@ -4,25 +4,31 @@ import argparse
 import fnmatch
 import importlib.util
 import inspect
+import os
 import re
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Hashable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from types import ModuleType, TracebackType
-from typing import Any, Literal, Self
+from types import FunctionType, ModuleType, TracebackType
+from typing import TYPE_CHECKING, Any, Literal, Self
 
 from interfacy.argparse_backend.argument_parser import ArgumentParser, namespace_to_dict
-from jinja2 import Environment
-from jinja2.ext import Extension
-from rich.table import Table
 from rich.text import Text
 
-from sprout.extensions import build_environment
-from sprout.prompt import ask_question, collect_answers, console, supports_live_interaction
+from sprout.prompt import (
+    ask_question,
+    collect_answers,
+    confirm_overwrite,
+    console,
+    supports_live_interaction,
+)
 from sprout.question import YES_NO_CHOICES, AnswerMap, DefaultValue, Question, parse_yes_no
 from sprout.registry import (
     TemplateRegistry,
@@ -34,6 +40,10 @@ from sprout.registry import (
 from sprout.scaffold import create_template_scaffold
 from sprout.style import Style
 
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+    from jinja2.ext import Extension
+
 
 @dataclass(frozen=True)
 class ManifestContext:
@@ -50,8 +60,8 @@ type ApplyCallable = Callable[[ManifestContext], CreatedPaths | Path | str]
 type TitleCallable = Callable[[ManifestContext], str | None]
 
 SkipPredicate = Callable[[str, AnswerMap], bool]
-QuestionsCallable = Callable[[Environment, Path], Sequence[Question]]
-QuestionsSource = Sequence[Question] | QuestionsCallable
+type QuestionsCallable = Callable[[Environment, Path], Sequence[Question]]
+type QuestionsSource = Sequence[Question] | QuestionsCallable
 CliBooleanStyle = Literal["flags", "yes-no"]
 
 
@@ -123,16 +133,18 @@ class TemplateSource:
         target_dir = Path(temporary_directory.name) / "template"
 
         try:
-            subprocess.run(  # noqa: S603 - validated git clone invocation
-                [git_executable, "clone", "--depth", "1", "--", url, str(target_dir)],
-                check=True,
-                capture_output=True,
-                text=True,
+            _run_git(
+                [
+                    git_executable,
+                    "clone",
+                    "--depth",
+                    "1",
+                    "--",
+                    url,
+                    str(target_dir),
+                ],
+                f"failed to clone template from {url}",
             )
-        except subprocess.CalledProcessError as e:  # pragma: no cover - external dependency
-            temporary_directory.cleanup()
-            stderr = e.stderr.strip() if e.stderr else str(e)
-            raise SystemExit(f"failed to clone template from {url}: {stderr}") from e
         except BaseException:
             temporary_directory.cleanup()
             raise
@@ -254,6 +266,8 @@ class ManifestReader:
         return style_obj
 
     def extensions(self) -> tuple[type[Extension], ...] | None:
+        from jinja2.ext import Extension
+
         extensions_obj = self.optional("extensions")
         if extensions_obj is None:
             return None
@@ -365,17 +379,7 @@ def ensure_destination(path: Path, *, force: bool, style: Style | None = None) -
 
 
 def _confirm_overwrite(path: Path, *, style: Style) -> bool:
-    if not supports_live_interaction():
-        return False
-
-    question = Question(
-        key="overwrite",
-        prompt=f"Allow overwriting files in '{path}'?",
-        choices=[("yes", "Yes"), ("no", "No")],
-        default="no",
-    )
-    answer = ask_question(question, {}, style)
-    return answer == "yes"
+    return confirm_overwrite(path, style=style)
 
 
 def _merge_ignore_patterns(ignore: Sequence[str] | None) -> list[str]:
@@ -387,11 +391,104 @@ def _merge_ignore_patterns(ignore: Sequence[str] | None) -> list[str]:
     return patterns
 
 
-def _should_ignore_path(path: Path, ignore_patterns: Sequence[str]) -> bool:
-    if "__pycache__" in path.parts:
-        return True
+def _compile_ignore_patterns(ignore_patterns: Sequence[str]) -> re.Pattern[str]:
+    patterns = ("__pycache__", *ignore_patterns)
+    translated = "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)
+
+    return re.compile(f"(?:{translated})")
+
+
+def _should_ignore_name(name: str, ignore_regex: re.Pattern[str]) -> bool:
+    return ignore_regex.match(os.path.normcase(name)) is not None
+
+
+def _iter_template_files(
+    template_dir: Path,
+    ignore_regex: re.Pattern[str],
+) -> Iterator[tuple[str, str]]:
+    root = str(template_dir)
+    prefix_len = len(root) if root.endswith(os.sep) else len(root) + 1
+
+    return _walk_template_directory(root, prefix_len, ignore_regex)
+
+
+def _walk_template_directory(
+    directory: str,
+    prefix_len: int,
+    ignore_regex: re.Pattern[str],
+) -> Iterator[tuple[str, str]]:
+    with os.scandir(directory) as iterator:
+        entries = sorted(iterator, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if _should_ignore_name(entry.name, ignore_regex):
+            continue
+
+        if entry.is_dir():
+            if not entry.is_symlink():
+                yield from _walk_template_directory(entry.path, prefix_len, ignore_regex)
+
+            continue
+
+        relative = entry.path[prefix_len:]
+        if os.sep != "/":
+            relative = relative.replace(os.sep, "/")
+
+        yield entry.path, relative
+
+
+def _fastcopy(source: Path, target: Path) -> None:
+    source_stat = source.stat()
+    if not _copy_file_range(source, target, source_stat.st_size):
+        shutil.copyfile(source, target)
+
+    target.chmod(stat.S_IMODE(source_stat.st_mode))
+    os.utime(target, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+
+
+def _copy_file_range(source: Path, target: Path, size: int) -> bool:
+    if sys.platform != "linux":
+        return False
+
+    try:
+        with source.open("rb") as source_file, target.open("wb") as target_file:
+            remaining = size
+            while remaining > 0:
+                copied = os.copy_file_range(source_file.fileno(), target_file.fileno(), remaining)
+                if copied == 0:
+                    return False
+
+                remaining -= copied
+    except OSError:
+        return False
+
+    return True
+
 
-    return any(fnmatch.fnmatch(path.name, pattern) for pattern in ignore_patterns)
+def _is_template_name(relative: str) -> bool:
+    name = relative.rpartition("/")[2]
+
+    return len(name) > len(".jinja") and name.endswith(".jinja")
+
+
+MAX_RENDER_WORKERS = 32
+RENDER_STREAM_BUFFER_SIZE = 5
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """
+    Describe one template file scheduled for rendering or copying.
+
+    Attributes:
+        source (str): Source file path inside the template directory.
+        target_relative (Path): Output path relative to the destination directory.
+        template (Template | None): Compiled template for `.jinja` sources, or None to copy.
+    """
+
+    source: str
+    target_relative: Path
+    template: Template | None
 
 
 class TemplateRenderer:
@@ -415,55 +512,110 @@ class TemplateRenderer:
         self.skip = skip
         self.render_paths = render_paths
         self.ignore_patterns = _merge_ignore_patterns(ignore)
+        self.ignore_regex = _compile_ignore_patterns(self.ignore_patterns)
+        self.path_markers = tuple(
+            marker
+            for marker in (
+                env.variable_start_string,
+                env.block_start_string,
+                env.comment_start_string,
+                env.line_statement_prefix,
+                env.line_comment_prefix,
+            )
+            if marker
+        )
+        self.path_templates: dict[str, Template] = {}
 
     def render(self) -> list[Path]:
-        created: list[Path] = []
+        jobs = self._collect_jobs()
+        write_jobs = list({job.target_relative: job for job in jobs}.values())
+        self._create_parent_directories(write_jobs)
+        if len(write_jobs) > 1:
+            max_workers = min(MAX_RENDER_WORKERS, (os.cpu_count() or 1) * 4, len(write_jobs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._render_job, job) for job in write_jobs]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+        else:
+            for job in write_jobs:
+                self._render_job(job)
 
-        for source in sorted(self.template_dir.rglob("*")):
-            if source.is_dir() or _should_ignore_path(source, self.ignore_patterns):
-                continue
+        return [job.target_relative for job in jobs]
 
-            relative = source.relative_to(self.template_dir)
-            relative_str = relative.as_posix()
+    def _collect_jobs(self) -> list[RenderJob]:
+        jobs: list[RenderJob] = []
+
+        for source_str, relative_str in _iter_template_files(
+            self.template_dir,
+            self.ignore_regex,
+        ):
             if self.skip and self.skip(relative_str, self.answers):
                 continue
 
-            target_relative = self._resolve_target_relative(source, relative)
-            self._render_source_file(source, target_relative, relative_str)
-            created.append(target_relative)
-
-        return created
+            is_template = _is_template_name(relative_str)
+            template = self.env.get_template(relative_str) if is_template else None
+            jobs.append(
+                RenderJob(
+                    source=source_str,
+                    target_relative=self._resolve_target_relative(relative_str, is_template),
+                    template=template,
+                )
+            )
 
-    def _resolve_target_relative(self, source: Path, relative: Path) -> Path:
-        if self.render_paths:
-            rendered = self.env.from_string(relative.as_posix()).render(**self.answers)
-            target_relative = Path(rendered)
-        else:
-            target_relative = relative
+        return jobs
 
-        if source.suffix == ".jinja":
-            target_relative = target_relative.with_suffix("")
+    def _resolve_target_relative(self, relative: str, is_template: bool) -> Path:
+        target = self._render_path(relative) if self.render_paths else relative
+        if is_template:
+            target = target.removesuffix(".jinja")
 
+        target_relative = Path(target)
         if target_relative == Path():
-            raise SystemExit(f"rendered path for '{relative.as_posix()}' must not be empty.")
+            raise SystemExit(f"rendered path for '{relative}' must not be empty.")
 
         if target_relative.is_absolute() or ".." in target_relative.parts:
             raise SystemExit(
-                f"rendered path for '{relative.as_posix()}' must stay within the destination directory."
+                f"rendered path for '{relative}' must stay within the destination directory."
             )
 
         return target_relative
 
-    def _render_source_file(self, source: Path, target_relative: Path, relative_str: str) -> None:
-        target_path = self.destination / target_relative
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        if source.suffix == ".jinja":
-            template = self.env.get_template(relative_str)
-            target_path.write_text(template.render(**self.answers), encoding="utf-8")
+    def _render_path(self, relative: str) -> str:
+        if not any(marker in relative for marker in self.path_markers):
+            return relative
+
+        template = self.path_templates.get(relative)
+        if template is None:
+            template = self.env.from_string(relative)
+            self.path_templates[relative] = template
+
+        return template.render(**self.answers)
+
+    def _create_parent_directories(self, jobs: Sequence[RenderJob]) -> None:
+        created_dirs: set[Path] = set()
+        for job in jobs:
+            parent = (self.destination / job.target_relative).parent
+            if parent in created_dirs:
+                continue
+
+            parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(parent)
+            created_dirs.update(parent.parents)
+
+    def _render_job(self, job: RenderJob) -> None:
+        target_path = self.destination / job.target_relative
+        if job.template is not None:
+            stream = job.template.stream(**self.answers)
+            stream.enable_buffering(RENDER_STREAM_BUFFER_SIZE)
+            stream.dump(str(target_path), encoding="utf-8")
 
             return
 
-        shutil.copy2(source, target_path)
+        _fastcopy(Path(job.source), target_path)
 
 
 def render_templates(
@@ -482,10 +634,13 @@ def render_templates(
 
     - If ``render_paths`` is True, treat relative paths as Jinja templates and render them with
       ``answers`` (useful for names like ``"{{ package_name }}"``).
-    - ``ignore`` is a list of glob patterns (matched against file name) and special names to skip.
+    - ``ignore`` is a list of glob patterns matched against file and directory names. Matching
+      directories, like ``__pycache__``, are not descended into.
     """
     if env is None:
-        env = build_environment(template_dir, extensions=extensions or ())
+        from sprout.extensions import _get_environment
+
+        env = _get_environment(template_dir, extensions)
 
     renderer = TemplateRenderer(
         env=env,
@@ -515,10 +670,8 @@ def summarize(created: Sequence[Path], destination: Path | None = None) -> None:
     if destination is not None:
         heading = f"{heading} in {destination}"
 
-    console.print(Text(heading, style="white"), soft_wrap=True)
-
-    for path in created:
-        console.print(Text(f"  • {path}", style="white"))
+    lines = "".join(f"\n  • {path}" for path in created)
+    console.print(Text(f"{heading}{lines}", style="white"), soft_wrap=True)
 
 
 def _resolve_actual_template_dir(root: Path, declared: str | Path | None) -> Path:
@@ -598,6 +751,8 @@ class ManifestExecution:
         initial_answers: dict[str, DefaultValue] | None = None,
         summary: Callable[[Sequence[Path]], None] | None = None,
     ) -> None:
+        from sprout.extensions import _get_environment
+
         self.manifest = manifest
         self.template_root = template_dir
         self.destination = destination
@@ -609,10 +764,7 @@ class ManifestExecution:
             self.template_root,
             manifest.template_dir,
         )
-        self.env = build_environment(
-            self.actual_template_dir,
-            extensions=manifest.extensions or (),
-        )
+        self.env = _get_environment(self.actual_template_dir, manifest.extensions)
         self.answers: dict[str, DefaultValue] = {}
 
     def execute(self) -> tuple[dict[str, DefaultValue], Sequence[Path] | None]:
@@ -767,6 +919,8 @@ def add_template(source: str, *, name: str | None = None) -> int:
 
 def list_templates() -> int:
     """List trusted template names and their sources."""
+    from rich.table import Table
+
     entries = TemplateRegistry().entries()
     if not entries:
         console.print("No trusted templates have been added.")
@@ -868,11 +1022,8 @@ def _normalise_created(created: Sequence[Path | str], destination: Path) -> list
     results: list[Path] = []
     for item in created:
         path = Path(item)
-        if path.is_absolute():
-            try:
-                path = path.relative_to(destination)
-            except ValueError:
-                pass
+        if path.is_absolute() and path.is_relative_to(destination):
+            path = path.relative_to(destination)
 
         results.append(path)
 
@@ -922,13 +1073,41 @@ def _invoke_context_hook(
     return hook(context)
 
 
+@lru_cache(maxsize=128)
+def _cached_signature_parameters(fn: Callable[..., object]) -> tuple[inspect.Parameter, ...]:
+    return tuple(inspect.signature(fn).parameters.values())
+
+
+def _signature_parameters(fn: Callable[..., object]) -> tuple[inspect.Parameter, ...]:
+    if isinstance(fn, Hashable):
+        return _cached_signature_parameters(fn)
+
+    return tuple(inspect.signature(fn).parameters.values())
+
+
+def _is_plain_context_function(fn: Callable[..., object]) -> bool:
+    if type(fn) is not FunctionType or hasattr(fn, "__wrapped__") or hasattr(fn, "__signature__"):
+        return False
+
+    code = fn.__code__
+    return (
+        code.co_argcount == 1
+        and code.co_kwonlyargcount == 0
+        and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+        and code.co_varnames[0] == "context"
+        and not fn.__defaults__
+    )
+
+
 def _validate_context_hook_signature(hook: Callable[..., object], hook_name: str) -> None:
+    if _is_plain_context_function(hook):
+        return
+
     try:
-        signature = inspect.signature(hook)
+        parameters = _signature_parameters(hook)
     except (TypeError, ValueError) as e:
         raise SystemExit(f"failed to inspect {hook_name}(): {e}") from e
 
-    parameters = tuple(signature.parameters.values())
     allowed_kinds = {
         inspect.Parameter.POSITIONAL_ONLY,
         inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -952,22 +1131,42 @@ def _resolve_git_executable() -> str:
     return git_executable
 
 
+def _run_git(args: list[str], failure: str) -> None:
+    try:
+        subprocess.run(  # noqa: S603 - validated git invocation
+            args,
+            check=True,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+        )
+    except subprocess.CalledProcessError as e:  # pragma: no cover - external dependency
+        stderr = e.stderr.strip() if e.stderr else str(e)
+        raise SystemExit(f"{failure}: {stderr}") from e
+
+
+_GITHUB_SHORTHAND_PATTERN = re.compile(r"(?P<owner>[^\s/]+)/(?P<repo>[^\s/]+?)(?:\.git)?")
+
+
 def _normalise_git_url(template_src: str) -> str:
     cleaned = template_src.strip()
     if cleaned.startswith(("http://", "https://", "git@", "ssh://")):
         return cleaned
 
-    if cleaned.count("/") == 1 and " " not in cleaned:
-        owner, repo = cleaned.split("/", maxsplit=1)
-        repo_name = repo if repo.endswith(".git") else f"{repo}.git"
-        return f"https://github.com/{owner}/{repo_name}"
+    shorthand = _GITHUB_SHORTHAND_PATTERN.fullmatch(cleaned)
+    if shorthand is not None:
+        return f"https://github.com/{shorthand['owner']}/{shorthand['repo']}.git"
 
     return cleaned
 
 
 def _load_manifest_module(template_dir: Path, manifest_path: Path) -> ModuleType:
     module_name = "sprout_template_manifest"
-    spec = importlib.util.spec_from_file_location(module_name, manifest_path)
+    spec = importlib.util.spec_from_file_location(
+        module_name,
+        manifest_path,
+        submodule_search_locations=[str(template_dir)],
+    )
     if spec is None or spec.loader is None:
         raise SystemExit(f"unable to load manifest from {manifest_path}.")
 
@@ -988,6 +1187,10 @@ def _load_manifest_module(template_dir: Path, manifest_path: Path) -> ModuleType
             except ValueError:
                 pass
 
+        submodule_prefix = f"{module_name}."
+        for name in [name for name in sys.modules if name.startswith(submodule_prefix)]:
+            del sys.modules[name]
+
         sys.modules.pop(module_name, None)
 
     return module
@@ -995,13 +1198,12 @@ def _load_manifest_module(template_dir: Path, manifest_path: Path) -> ModuleType
 
 def _validate_questions_signature(questions: Callable[..., object]) -> None:
     try:
-        signature = inspect.signature(questions)
+        parameters = _signature_parameters(questions)
     except (TypeError, ValueError) as e:
         raise SystemExit(
             "questions callable in sprout.py must accept (env, destination) parameters."
         ) from e
 
-    parameters = tuple(signature.parameters.values())
     allowed_kinds = {
         inspect.Parameter.POSITIONAL_ONLY,
         inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -1030,14 +1232,13 @@ def _validate_questions_sequence(value: Any) -> Sequence[Question]:  # noqa: ANN
 
 def _validate_skip_signature(skip: Callable[..., object]) -> None:
     try:
-        signature = inspect.signature(skip)
+        parameters = _signature_parameters(skip)
     except (TypeError, ValueError) as e:
         raise SystemExit(
             "should_skip_file in sprout.py must be a callable with "
             "(relative_path: str, answers) parameters."
         ) from e
 
-    parameters = tuple(signature.parameters.values())
     allowed_kinds = {
         inspect.Parameter.POSITIONAL_ONLY,
         inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -1058,7 +1259,20 @@ def _load_manifest(template_dir: Path) -> Manifest:
     if not manifest_path.is_file():
         raise SystemExit(f"template source {template_dir} is missing sprout.py.")
 
-    module = _load_manifest_module(template_dir, manifest_path)
+    manifest_stat = manifest_path.stat()
+
+    return _load_manifest_cached(
+        str(manifest_path),
+        manifest_stat.st_mtime_ns,
+        manifest_stat.st_size,
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_manifest_cached(manifest_path: str, mtime_ns: int, size: int) -> Manifest:
+    del mtime_ns, size
+    path = Path(manifest_path)
+    module = _load_manifest_module(path.parent, path)
     reader = ManifestReader(vars(module))
 
     return Manifest(
@@ -1173,12 +1387,14 @@ def _extract_template_destination(
 
 
 def _load_questions_for_cli(template_src: str, destination: Path) -> PreparedTemplate:
+    from sprout.extensions import _get_environment
+
     source = TemplateSource.from_source(template_src)
     try:
         template_dir = source.root
         manifest = _load_manifest(template_dir)
         actual_template_dir = _resolve_actual_template_dir(template_dir, manifest.template_dir)
-        env = build_environment(actual_template_dir, extensions=manifest.extensions or ())
+        env = _get_environment(actual_template_dir, manifest.extensions)
         questions = _resolve_questions(manifest.questions, env, destination)
     except (Exception, KeyboardInterrupt, SystemExit):
         source.close()
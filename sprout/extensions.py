@@ -2,14 +2,40 @@ from __future__ import annotations
 
 import configparser
 import datetime as dt
+import hashlib
 import os
 import re
+import sys
 from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
+from types import FunctionType
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from jinja2.bccache import Bucket
 from jinja2.ext import Extension
 
+_ORIGIN_REMOTE_SECTION = 'remote "origin"'
+
+
+@lru_cache(maxsize=32)
+def _read_git_config(
+    config_path: str,
+    mtime_ns: int,
+    size: int,
+) -> configparser.ConfigParser | None:
+    del mtime_ns, size
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        loaded_paths = parser.read(config_path, encoding="utf-8")
+    except (configparser.Error, OSError, UnicodeDecodeError):
+        return None
+
+    if not loaded_paths:
+        return None
+
+    return parser
+
 
 def _set_environment_global(environment: Environment, name: str, value: str | int) -> None:
     environment.globals[name] = value  # pyrefly: ignore[unsupported-operation]
@@ -21,6 +47,11 @@ class GitDefaultsExtension(Extension):
     def __init__(self, environment: Environment) -> None:
         super().__init__(environment)
 
+        self.refresh_globals()
+
+    def refresh_globals(self) -> None:
+        """Re-read Git configuration for the current directory and update the globals."""
+        environment = self.environment
         self._repo_config_path = self._find_repo_config_path(Path.cwd())
         self._config_paths = self._collect_git_config_paths(self._repo_config_path)
         _set_environment_global(environment, "git_user_name", self._get_git_config("user.name"))
@@ -82,16 +113,12 @@ class GitDefaultsExtension(Extension):
         return (git_file.parent / git_path).resolve()
 
     def _load_config(self, config_path: Path) -> configparser.ConfigParser | None:
-        parser = configparser.ConfigParser(interpolation=None)
         try:
-            loaded_paths = parser.read(config_path, encoding="utf-8")
-        except (configparser.Error, OSError, UnicodeDecodeError):
-            return None
-
-        if not loaded_paths:
+            stat_result = config_path.stat()
+        except OSError:
             return None
 
-        return parser
+        return _read_git_config(str(config_path), stat_result.st_mtime_ns, stat_result.st_size)
 
     def _get_git_config(self, key: str) -> str:
         section, separator, option = key.partition(".")
@@ -114,10 +141,11 @@ class GitDefaultsExtension(Extension):
         if self._repo_config_path is not None:
             parser = self._load_config(self._repo_config_path)
             if parser is not None:
-                for section in parser.sections():
-                    if not section.startswith('remote "'):
-                        continue
-
+                remotes = [
+                    section for section in parser.sections() if section.startswith('remote "')
+                ]
+                remotes.sort(key=lambda section: section != _ORIGIN_REMOTE_SECTION)
+                for section in remotes:
                     remote_url = parser.get(section, "url", fallback="")
                     match = re.search(r"github\.com[:/]([^/]+)", remote_url)
                     if match:
@@ -132,10 +160,85 @@ class CurrentYearExtension(Extension):
     def __init__(self, environment: Environment) -> None:
         super().__init__(environment)
 
-        _set_environment_global(environment, "current_year", dt.datetime.now(tz=dt.UTC).year)
+        self.refresh_globals()
+
+    def refresh_globals(self) -> None:
+        """Update the `current_year` global to the current UTC year."""
+        _set_environment_global(self.environment, "current_year", dt.datetime.now(tz=dt.UTC).year)
 
 
 DEFAULT_EXTENSIONS: tuple[type[Extension], ...] = (GitDefaultsExtension,)
+BYTECODE_CACHE_PATTERN = "sprout-{settings}-%s.cache"
+TEMPLATE_CACHE_SIZE = 1000
+
+
+def _extension_fingerprint(extension: type[Extension]) -> str | None:
+    module = sys.modules.get(extension.__module__)
+    module_file = getattr(module, "__file__", None)
+    source_files = {module_file} if isinstance(module_file, str) else set()
+    source_files.update(
+        value.__code__.co_filename
+        for value in vars(extension).values()
+        if isinstance(value, FunctionType)
+    )
+    if not source_files:
+        return None
+
+    versions: list[str] = []
+    for source_file in sorted(source_files):
+        try:
+            stat_result = Path(source_file).stat()
+        except OSError:
+            return None
+
+        versions.append(f"{source_file}:{stat_result.st_mtime_ns}:{stat_result.st_size}")
+
+    return f"{extension.__module__}.{extension.__qualname__}@{','.join(versions)}"
+
+
+def _bytecode_cache_pattern(
+    extensions: Sequence[type[Extension]],
+    *,
+    autoescape: bool,
+    keep_trailing_newline: bool,
+) -> str | None:
+    fingerprints = [_extension_fingerprint(extension) for extension in extensions]
+    if None in fingerprints:
+        return None
+
+    settings = [
+        f"autoescape={autoescape}",
+        f"keep_trailing_newline={keep_trailing_newline}",
+        *(fingerprint for fingerprint in fingerprints if fingerprint is not None),
+    ]
+    digest = hashlib.sha256("\n".join(settings).encode()).hexdigest()[:16]
+
+    return BYTECODE_CACHE_PATTERN.format(settings=digest)
+
+
+class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except OSError:
+            bucket.reset()
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            return
+
+
+def _build_bytecode_cache(directory: Path | None, pattern: str) -> FileSystemBytecodeCache | None:
+    try:
+        if directory is None:
+            return _BestEffortBytecodeCache(pattern=pattern)
+
+        directory.mkdir(parents=True, exist_ok=True)
+        return _BestEffortBytecodeCache(directory=str(directory), pattern=pattern)
+    except (OSError, RuntimeError):
+        return None
 
 
 def build_environment(
@@ -144,6 +247,7 @@ def build_environment(
     extensions: Sequence[type[Extension]] | None = None,
     autoescape: bool = False,
     keep_trailing_newline: bool = True,
+    bytecode_cache_dir: Path | None = None,
 ) -> Environment:
     """
     Build a Jinja environment configured for sprout templates.
@@ -154,7 +258,20 @@ def build_environment(
             If None, use `DEFAULT_EXTENSIONS`. Duplicate classes are ignored.
         autoescape (bool): Whether to enable Jinja autoescaping for HTML/XML-like templates.
         keep_trailing_newline (bool): Whether to preserve a final newline during rendering.
+        bytecode_cache_dir (Path | None): Directory for compiled template bytecode. If None, use
+            Jinja's per-user cache directory in the system temp directory. Cache files are
+            namespaced by the settings above, so differently configured environments never
+            share compiled code. The namespace also covers the source files of the extensions,
+            so editing an extension invalidates its cached code. If the cache directory cannot
+            be used, or an extension has no source file to check, templates are compiled
+            without a bytecode cache.
     """
+    extension_classes = tuple(dict.fromkeys(extensions or DEFAULT_EXTENSIONS))
+    cache_pattern = _bytecode_cache_pattern(
+        extension_classes,
+        autoescape=autoescape,
+        keep_trailing_newline=keep_trailing_newline,
+    )
     env = Environment(
         loader=FileSystemLoader(str(template_dir)),
         autoescape=select_autoescape(
@@ -163,17 +280,40 @@ def build_environment(
             default=autoescape,
         ),
         keep_trailing_newline=keep_trailing_newline,
+        auto_reload=False,
+        cache_size=TEMPLATE_CACHE_SIZE,
+        bytecode_cache=(
+            None
+            if cache_pattern is None
+            else _build_bytecode_cache(bytecode_cache_dir, cache_pattern)
+        ),
     )
 
-    extensions = extensions or DEFAULT_EXTENSIONS
-    applied: set[type[Extension]] = set()
+    for extension_cls in extension_classes:
+        env.add_extension(extension_cls)
+
+    return env
 
-    for extension_cls in extensions or ():
-        if extension_cls in applied:
-            continue
 
-        extension_cls(env)
-        applied.add(extension_cls)
+@lru_cache(maxsize=32)
+def _cached_environment(
+    template_dir: Path,
+    extensions: tuple[type[Extension], ...],
+) -> Environment:
+    env = build_environment(template_dir, extensions=extensions)
+    env.auto_reload = True
+
+    return env
+
+
+def _get_environment(
+    template_dir: Path,
+    extensions: Sequence[type[Extension]] | None = None,
+) -> Environment:
+    env = _cached_environment(template_dir.resolve(), tuple(extensions or ()))
+    for extension in env.extensions.values():
+        if isinstance(extension, GitDefaultsExtension | CurrentYearExtension):
+            extension.refresh_globals()
 
     return env
 
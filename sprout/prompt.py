@@ -3,17 +3,12 @@ from __future__ import annotations
 import sys
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-from prompt_toolkit import PromptSession
-from prompt_toolkit.application import Application
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.layout import HSplit, Layout, Window
-from prompt_toolkit.layout.controls import FormattedTextControl
-from prompt_toolkit.styles import Style as PTStyle
+from typing import TYPE_CHECKING, TextIO
+from weakref import WeakKeyDictionary
+
 from rich.console import Console
-from rich.control import Control, ControlType
 from rich.text import Text
 
 from sprout.prompt_model import (
@@ -27,13 +22,16 @@ from sprout.question import AnswerMap, DefaultValue, Question
 from sprout.style import Style
 
 if TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.application import AppSession
     from prompt_toolkit.buffer import Buffer
+    from prompt_toolkit.key_binding import KeyBindings
     from prompt_toolkit.key_binding.key_processor import KeyPressEvent
+    from prompt_toolkit.styles import Style as PTStyle
 
 
 console = Console()
 type ChoiceLabelMap = Mapping[str, str | None]
-type ChoiceChoiceMap = dict[str, str | None]
 
 
 def collect_answers(
@@ -93,6 +91,7 @@ class QuestionPrompt:
         self.answers = answers
         self.style = style
         self.resolved = ResolvedPrompt.from_question(question, answers)
+        self.value_to_label: ChoiceLabelMap = dict(self.resolved.choices)
         self.processor = AnswerProcessor(question, answers)
 
     def ask(self) -> DefaultValue:
@@ -103,7 +102,7 @@ class QuestionPrompt:
             _print_choice_summary(
                 self.question,
                 selection,
-                dict(self.resolved.choices),
+                self.value_to_label,
                 self.style,
             )
 
@@ -145,11 +144,10 @@ class QuestionPrompt:
         console.print(header)
 
     def _ask_choice(self) -> DefaultValue:
-        choices = list(self.resolved.choices)
+        choices = self.resolved.choices
         if not choices:
             return self.resolved.default_value
 
-        value_to_label = dict(choices)
         current_default = self.resolved.default_value
 
         while True:
@@ -161,7 +159,7 @@ class QuestionPrompt:
                     answers=self.answers,
                     default_value=current_default,
                     choices=choices,
-                    value_to_label=value_to_label,
+                    value_to_label=self.value_to_label,
                     style=self.style,
                 ).ask()
 
@@ -171,7 +169,7 @@ class QuestionPrompt:
                 _print_choice_summary(
                     self.question,
                     selection,
-                    value_to_label,
+                    self.value_to_label,
                     self.style,
                 )
             except ValueError as e:
@@ -185,7 +183,7 @@ class QuestionPrompt:
 
         while True:
             if supports_live_interaction():
-                session: PromptSession[str] = PromptSession()
+                session = _text_prompt_session()
                 has_default = default_value not in (None, "", [])
 
                 if has_default:
@@ -196,11 +194,11 @@ class QuestionPrompt:
                         key_bindings=_placeholder_key_bindings(default_str),
                     )
                 else:
+                    session.placeholder = None
+                    session.key_bindings = None
                     response = session.prompt(f"{self.style.input_prefix} ")
             else:
-                response = console.input(
-                    f"[bold green]{self.style.input_prefix} [/bold green]"
-                ).strip()
+                response = console.input(_input_prompt(self.style)).strip()
 
             stripped = response.strip()
             if not stripped:
@@ -231,23 +229,22 @@ class QuestionPrompt:
         if not self.resolved.inline_choice_enabled or not self.resolved.choices:
             return ""
 
-        parts: list[str] = []
-        for value, label in self.resolved.choices:
-            icon = (
-                self.style.inline.selected_icon
-                if value == self.resolved.default_value
-                else self.style.inline.unselected_icon
-            )
-            parts.append(f"{icon} {label or value}")
+        inline = self.style.inline
+        default_value = self.resolved.default_value
+        parts = [
+            f"{inline.selected_icon if value == default_value else inline.unselected_icon} "
+            f"{label or value}"
+            for value, label in self.resolved.choices
+        ]
 
-        return self.style.inline.separator.join(parts)
+        return inline.separator.join(parts)
 
     def _run_choice_application(
         self,
         choices: Sequence[Choice],
         default_value: DefaultValue,
     ) -> DefaultValue:
-        items = list(choices)
+        items = choices if isinstance(choices, tuple) else tuple(choices)
         if not items:
             return default_value
 
@@ -268,63 +265,69 @@ class QuestionPrompt:
 
         pointer_box = [pointer]
         selected_box = set(selected_indices)
-        pt_style = PTStyle.from_dict(
-            {
-                "title": self.style.prompt.text_style,
-                "hint": self.style.menu.instruction_style,
-                "caret": self.style.menu.caret_style,
-                "bullet.sel": self.style.menu.bullet_selected_style,
-                "bullet": self.style.menu.bullet_unselected_style,
-                "text.sel": self.style.menu.text_selected_style,
-                "text": self.style.menu.text_unselected_style,
-            }
+        pt_style = _menu_pt_style(
+            self.style.prompt.text_style,
+            self.style.menu.instruction_style,
+            self.style.menu.caret_style,
+            self.style.menu.bullet_selected_style,
+            self.style.menu.bullet_unselected_style,
+            self.style.menu.text_selected_style,
+            self.style.menu.text_unselected_style,
         )
 
+        menu = self.style.menu
+        multiselect = self.question.multiselect
+        caret_fragment = ("class:caret", menu.caret_icon)
+        blank_caret_fragment = ("", " " * len(menu.caret_icon))
+        bullet_selected_fragment = ("class:bullet.sel", menu.bullet_selected_icon)
+        bullet_unselected_fragment = ("class:bullet", menu.bullet_unselected_icon)
+        rows = [
+            (("class:text", label or value), ("class:text.sel", label or value))
+            for value, label in items
+        ]
+        newline_fragment = ("", "\n")
+
         def _render() -> list[tuple[str, str]]:
+            pointer = pointer_box[0]
             fragments: list[tuple[str, str]] = []
 
-            for idx, (value, label) in enumerate(items):
-                caret = (
-                    self.style.menu.caret_icon
-                    if idx == pointer_box[0]
-                    else " " * len(self.style.menu.caret_icon)
-                )
-                caret_style = "class:caret" if idx == pointer_box[0] else ""
-                bullet_selected = (
-                    idx in selected_box if self.question.multiselect else idx == pointer_box[0]
-                )
-                bullet_style = "class:bullet.sel" if bullet_selected else "class:bullet"
-                bullet = (
-                    self.style.menu.bullet_selected_icon
-                    if bullet_selected
-                    else self.style.menu.bullet_unselected_icon
-                )
-                text_style = "class:text.sel" if idx == pointer_box[0] else "class:text"
-                display = label or value
-
-                fragments.append((caret_style, caret))
-                fragments.append((bullet_style, bullet))
-                fragments.append((text_style, display))
+            for idx, (text_fragment, text_selected_fragment) in enumerate(rows):
+                if idx:
+                    fragments.append(newline_fragment)
 
-                if idx != len(items) - 1:
-                    fragments.append(("", "\n"))
+                is_pointer = idx == pointer
+                bullet_selected = idx in selected_box if multiselect else is_pointer
+                fragments.append(caret_fragment if is_pointer else blank_caret_fragment)
+                fragments.append(
+                    bullet_selected_fragment if bullet_selected else bullet_unselected_fragment
+                )
+                fragments.append(text_selected_fragment if is_pointer else text_fragment)
 
             return fragments
 
+        from prompt_toolkit.application import Application
+        from prompt_toolkit.layout import Dimension, Layout, Window
+        from prompt_toolkit.layout.controls import FormattedTextControl
+
         body_control = FormattedTextControl(_render)
-        body = Window(content=body_control, always_hide_cursor=True)
+        body = Window(
+            content=body_control,
+            height=Dimension(min=len(items)),
+            always_hide_cursor=True,
+        )
         app: Application[object] = Application(
-            layout=Layout(HSplit([body])),
-            key_bindings=ChoiceKeyBindings(
-                pointer_box=pointer_box,
-                selected_box=selected_box,
-                items=items,
-                multiselect=self.question.multiselect,
-            ).build(),
+            layout=Layout(body),
+            key_bindings=_choice_key_bindings(multiselect=self.question.multiselect),
             mouse_support=False,
             full_screen=False,
             style=pt_style,
         )
+        _CHOICE_MENU_STATES[app] = ChoiceMenuState(
+            pointer_box=pointer_box,
+            selected_box=selected_box,
+            items=items,
+            multiselect=self.question.multiselect,
+        )
 
         result = app.run()
         if result is None:
@@ -336,87 +339,77 @@ class QuestionPrompt:
         return result
 
     def _run_inline_application(self) -> DefaultValue:
-        items = list(self.resolved.choices)
+        items = self.resolved.choices
         value_to_index = {value: idx for idx, (value, _) in enumerate(items)}
         default_value = self.resolved.default_value
         pointer = value_to_index.get(default_value, 0) if isinstance(default_value, str) else 0
         pointer_box = [pointer]
 
-        pt_style = PTStyle.from_dict(
-            {
-                "prompt": self.style.prompt.text_style,
-                "prefix": self.style.prompt.prefix_style,
-                "bullet.sel": self.style.inline.bullet_selected_style,
-                "bullet": self.style.inline.bullet_unselected_style,
-                "text.sel": self.style.inline.text_selected_style,
-                "text": self.style.inline.text_unselected_style,
-                "hint": self.style.inline.instruction_style,
-            }
+        pt_style = _inline_pt_style(
+            self.style.prompt.text_style,
+            self.style.prompt.prefix_style,
+            self.style.inline.bullet_selected_style,
+            self.style.inline.bullet_unselected_style,
+            self.style.inline.text_selected_style,
+            self.style.inline.text_unselected_style,
+            self.style.inline.instruction_style,
+        )
+
+        inline = self.style.inline
+        leading_fragments = [
+            ("class:prefix", self.style.prompt.prefix),
+            ("class:prompt", f"{self.question.prompt} "),
+        ]
+        bullet_selected_fragment = ("class:bullet.sel", inline.selected_icon)
+        bullet_unselected_fragment = ("class:bullet", inline.unselected_icon)
+        space_fragment = ("", " ")
+        separator_fragment = ("", inline.separator)
+        rows = [
+            (("class:text", label or value), ("class:text.sel", label or value))
+            for value, label in items
+        ]
+        trailing_fragments = (
+            [("", "  "), ("class:hint", inline.instruction)] if inline.instruction else []
         )
 
         def _render() -> list[tuple[str, str]]:
-            fragments: list[tuple[str, str]] = [
-                ("class:prefix", self.style.prompt.prefix),
-                ("class:prompt", f"{self.question.prompt} "),
-            ]
-
-            for idx, (value, label) in enumerate(items):
-                selected = idx == pointer_box[0]
-                bullet_style = "class:bullet.sel" if selected else "class:bullet"
-                bullet = (
-                    self.style.inline.selected_icon
-                    if selected
-                    else self.style.inline.unselected_icon
-                )
-                text_style = "class:text.sel" if selected else "class:text"
-                display = label or value
+            pointer = pointer_box[0]
+            fragments = list(leading_fragments)
 
-                fragments.append((bullet_style, bullet))
-                fragments.append(("", " "))
-                fragments.append((text_style, display))
+            for idx, (text_fragment, text_selected_fragment) in enumerate(rows):
+                if idx:
+                    fragments.append(separator_fragment)
 
-                if idx != len(items) - 1:
-                    fragments.append(("", self.style.inline.separator))
+                selected = idx == pointer
+                fragments.append(
+                    bullet_selected_fragment if selected else bullet_unselected_fragment
+                )
+                fragments.append(space_fragment)
+                fragments.append(text_selected_fragment if selected else text_fragment)
 
-            if self.style.inline.instruction:
-                fragments.append(("", "  "))
-                fragments.append(("class:hint", self.style.inline.instruction))
+            fragments.extend(trailing_fragments)
 
             return fragments
 
+        from prompt_toolkit.application import Application
+        from prompt_toolkit.layout import Layout, Window
+        from prompt_toolkit.layout.controls import FormattedTextControl
+
         body_control = FormattedTextControl(_render)
         body = Window(content=body_control, height=1, always_hide_cursor=True)
-        keybind = KeyBindings()
-
-        @keybind.add("left")
-        @keybind.add("h")
-        @keybind.add("up")
-        def _go_left(event: KeyPressEvent) -> None:  # pragma: no cover - interactive
-            pointer_box[0] = (pointer_box[0] - 1) % len(items)
-            event.app.invalidate()
-
-        @keybind.add("right")
-        @keybind.add("l")
-        @keybind.add("down")
-        def _go_right(event: KeyPressEvent) -> None:  # pragma: no cover - interactive
-            pointer_box[0] = (pointer_box[0] + 1) % len(items)
-            event.app.invalidate()
-
-        @keybind.add("enter")
-        def _confirm(event: KeyPressEvent) -> None:  # pragma: no cover - interactive
-            event.app.exit(result=items[pointer_box[0]][0])
-
-        @keybind.add("c-c")
-        def _interrupt(event: KeyPressEvent) -> None:  # pragma: no cover - interactive
-            event.app.exit(exception=KeyboardInterrupt)
-
         app: Application[object] = Application(
-            layout=Layout(HSplit([body])),
-            key_bindings=keybind,
+            layout=Layout(body),
+            key_bindings=_inline_key_bindings(),
             mouse_support=False,
             full_screen=False,
             style=pt_style,
         )
+        _CHOICE_MENU_STATES[app] = ChoiceMenuState(
+            pointer_box=pointer_box,
+            selected_box=set(),
+            items=items,
+            multiselect=False,
+        )
 
         result = app.run()
         if result is None:
@@ -425,6 +418,56 @@ class QuestionPrompt:
         return result
 
 
+@lru_cache(maxsize=32)
+def _menu_pt_style(  # noqa: PLR0917
+    title: str,
+    hint: str,
+    caret: str,
+    bullet_selected: str,
+    bullet_unselected: str,
+    text_selected: str,
+    text_unselected: str,
+) -> PTStyle:
+    from prompt_toolkit.styles import Style as PTStyle
+
+    return PTStyle.from_dict(
+        {
+            "title": title,
+            "hint": hint,
+            "caret": caret,
+            "bullet.sel": bullet_selected,
+            "bullet": bullet_unselected,
+            "text.sel": text_selected,
+            "text": text_unselected,
+        }
+    )
+
+
+@lru_cache(maxsize=32)
+def _inline_pt_style(  # noqa: PLR0917
+    prompt: str,
+    prefix: str,
+    bullet_selected: str,
+    bullet_unselected: str,
+    text_selected: str,
+    text_unselected: str,
+    hint: str,
+) -> PTStyle:
+    from prompt_toolkit.styles import Style as PTStyle
+
+    return PTStyle.from_dict(
+        {
+            "prompt": prompt,
+            "prefix": prefix,
+            "bullet.sel": bullet_selected,
+            "bullet": bullet_unselected,
+            "text.sel": text_selected,
+            "text": text_unselected,
+            "hint": hint,
+        }
+    )
+
+
 def ask_question(
     question: Question, answers: dict[str, DefaultValue], style: Style
 ) -> DefaultValue:
@@ -440,42 +483,106 @@ def confirm_overwrite(path: Path, *, style: Style) -> bool:
         path (Path): Destination path shown in the confirmation prompt.
         style (Style): Prompt rendering configuration.
     """
+    return _confirm_yn(f"Allow overwriting files in '{path}'?", default=False, style=style)
+
+
+def _confirm_yn(prompt: str, *, default: bool, style: Style) -> bool:
     if not supports_live_interaction():
-        return False
+        return default
 
-    question = Question(
-        key="overwrite",
-        prompt=f"Allow overwriting files in {path}?",
-        choices=[("yes", "Yes"), ("no", "No")],
-        default="no",
+    from prompt_toolkit.formatted_text import FormattedText
+    from prompt_toolkit.key_binding import merge_key_bindings
+    from prompt_toolkit.shortcuts import create_confirm_session
+
+    message = FormattedText(
+        [
+            (style.prompt.prefix_style, style.prompt.prefix),
+            (style.prompt.text_style, prompt),
+        ]
+    )
+    session = create_confirm_session(message, suffix=" (Y/n) " if default else " (y/N) ")
+    keybind = _new_key_bindings()
+
+    @keybind.add("enter")
+    def _accept_default(event: KeyPressEvent) -> None:
+        session.default_buffer.text = "y" if default else "n"
+        event.app.exit(result=default)
+
+    confirm_bindings = session.key_bindings
+    session.key_bindings = (
+        keybind if confirm_bindings is None else merge_key_bindings([confirm_bindings, keybind])
     )
-    answer = ask_question(question, {}, style)
-    return answer == "yes"
+
+    return bool(session.prompt())
+
+
+def _new_key_bindings() -> KeyBindings:
+    from prompt_toolkit.key_binding import KeyBindings
+
+    return KeyBindings()
 
 
 @dataclass
-class ChoiceKeyBindings:
+class ChoiceMenuState:
     pointer_box: list[int]
     selected_box: set[int]
     items: Sequence[Choice]
     multiselect: bool
-    keybind: KeyBindings = field(default_factory=KeyBindings, init=False)
+
+    def move(self, *, delta: int | None = None, position: int | None = None) -> None:
+        item_count = len(self.items)
+        if position is None:
+            self.pointer_box[0] = (self.pointer_box[0] + (delta or 0)) % item_count
+        elif position < 0:
+            self.pointer_box[0] = item_count - 1
+        else:
+            self.pointer_box[0] = position
+
+    def toggle(self) -> None:
+        idx = self.pointer_box[0]
+        if idx in self.selected_box:
+            self.selected_box.remove(idx)
+        else:
+            self.selected_box.add(idx)
+
+    def result(self) -> str | list[str]:
+        if self.multiselect:
+            return [self.items[idx][0] for idx in sorted(self.selected_box)]
+
+        return self.items[self.pointer_box[0]][0]
+
+
+_CHOICE_MENU_STATES: WeakKeyDictionary[object, ChoiceMenuState] = WeakKeyDictionary()
+
+
+def _choice_menu_state(event: KeyPressEvent) -> ChoiceMenuState:
+    return _CHOICE_MENU_STATES[event.app]
+
+
+@dataclass
+class ChoiceKeyBindings:
+    multiselect: bool
+    up_keys: Sequence[str] = ("up", "k", "left", "h")
+    down_keys: Sequence[str] = ("down", "j", "right", "l")
+    jump_keys: bool = True
+    keybind: KeyBindings = field(default_factory=_new_key_bindings, init=False)
 
     def build(self) -> KeyBindings:
-        for key in ("up", "k", "left", "h"):
+        for key in self.up_keys:
             self._bind_move_key(key, delta=-1)
 
-        for key in ("down", "j", "right", "l"):
+        for key in self.down_keys:
             self._bind_move_key(key, delta=1)
 
-        self._bind_move_key("home", position=0)
-        self._bind_move_key("end", position=-1)
+        if self.jump_keys:
+            self._bind_move_key("home", position=0)
+            self._bind_move_key("end", position=-1)
 
         if self.multiselect:
             self._bind_toggle_key()
 
         self._bind_confirm_key()
-        self._bind_interrupt_key()
+        _bind_interrupt_key(self.keybind)
 
         return self.keybind
 
@@ -486,48 +593,36 @@ class ChoiceKeyBindings:
         delta: int | None = None,
         position: int | None = None,
     ) -> None:
-        item_count = len(self.items)
-
         @self.keybind.add(key)
-        def _move(
-            event: KeyPressEvent,
-            _delta: int | None = delta,
-            _position: int | None = position,
-        ) -> None:  # pragma: no cover - interactive
-            if _position is None:
-                self.pointer_box[0] = (self.pointer_box[0] + (_delta or 0)) % item_count
-            elif _position < 0:
-                self.pointer_box[0] = item_count - 1
-            else:
-                self.pointer_box[0] = _position
-
+        def _move(event: KeyPressEvent) -> None:
+            _choice_menu_state(event).move(delta=delta, position=position)
             event.app.invalidate()
 
     def _bind_toggle_key(self) -> None:
         @self.keybind.add(" ")
-        def _toggle(event: KeyPressEvent) -> None:  # pragma: no cover - interactive
-            idx = self.pointer_box[0]
-            if idx in self.selected_box:
-                self.selected_box.remove(idx)
-            else:
-                self.selected_box.add(idx)
-
+        def _toggle(event: KeyPressEvent) -> None:
+            _choice_menu_state(event).toggle()
             event.app.invalidate()
 
     def _bind_confirm_key(self) -> None:
         @self.keybind.add("enter")
-        def _confirm(event: KeyPressEvent) -> None:  # pragma: no cover - interactive
-            if self.multiselect:
-                result: str | list[str] = [self.items[idx][0] for idx in sorted(self.selected_box)]
-            else:
-                result = self.items[self.pointer_box[0]][0]
+        def _confirm(event: KeyPressEvent) -> None:
+            event.app.exit(result=_choice_menu_state(event).result())
 
-            event.app.exit(result=result)
 
-    def _bind_interrupt_key(self) -> None:
-        @self.keybind.add("c-c")
-        def _interrupt(event: KeyPressEvent) -> None:  # pragma: no cover - interactive
-            event.app.exit(exception=KeyboardInterrupt)
+@lru_cache(maxsize=2)
+def _choice_key_bindings(*, multiselect: bool) -> KeyBindings:
+    return ChoiceKeyBindings(multiselect=multiselect).build()
+
+
+@lru_cache(maxsize=1)
+def _inline_key_bindings() -> KeyBindings:
+    return ChoiceKeyBindings(
+        multiselect=False,
+        up_keys=("left", "h", "up"),
+        down_keys=("right", "l", "down"),
+        jump_keys=False,
+    ).build()
 
 
 def _bind_interrupt_key(keybind: KeyBindings) -> None:
@@ -544,17 +639,15 @@ class FallbackChoicePrompt:
         answers: dict[str, DefaultValue],
         default_value: DefaultValue,
         choices: Sequence[Choice],
-        value_to_label: ChoiceLabelMap | None = None,
+        value_to_label: ChoiceLabelMap,
         style: Style | None = None,
     ) -> None:
         self.question = question
         self.answers = answers
         self.default_value = default_value
-        self.choices = list(choices)
+        self.choices = choices if isinstance(choices, tuple) else tuple(choices)
         self.style = style or Style()
-        self.mapping: ChoiceChoiceMap = (
-            dict(value_to_label) if value_to_label is not None else dict(self.choices)
-        )
+        self.mapping = value_to_label
         self.default_list = _fallback_default_values(question, default_value)
         self.value_map, self.label_map, self.index_map = _fallback_lookup_maps(self.choices)
         self.processor = AnswerProcessor(question, answers)
@@ -572,7 +665,7 @@ class FallbackChoicePrompt:
         )
 
         while True:
-            response = console.input(f"[bold green]{self.style.input_prefix} [/bold green]").strip()
+            response = console.input(_input_prompt(self.style)).strip()
             candidate = self.resolve_choice(response)
             if candidate is None:
                 continue
@@ -630,9 +723,12 @@ class FallbackChoicePrompt:
         return processed
 
     def _resolve_multiselect(self, response: str) -> list[str] | None:
-        tokens = [token.strip() for token in response.split(",") if token.strip()]
         resolved: list[str] = []
-        for token in tokens:
+        for raw_token in response.split(","):
+            token = raw_token.strip()
+            if not token:
+                continue
+
             value = self._resolve_token(token)
             if value is None:
                 _print_error(f"Unknown choice '{token}'.", self.style)
@@ -643,11 +739,14 @@ class FallbackChoicePrompt:
         return resolved
 
     def _resolve_token(self, token: str) -> str | None:
+        value = self.index_map.get(token)
+        if value is not None:
+            return value
+
         lower = token.lower()
-        if token in self.index_map:
-            return self.index_map[token]
-        if lower in self.value_map:
-            return self.value_map[lower]
+        value = self.value_map.get(lower)
+        if value is not None:
+            return value
 
         return self.label_map.get(lower)
 
@@ -668,38 +767,39 @@ def _print_fallback_choices(
     default_list: Sequence[str],
     style: Style,
 ) -> None:
+    body = Text()
+    index_style = style.default_style
     for idx, (value, label) in enumerate(choices, start=1):
-        line = Text()
-        line.append(f"  {idx}) ", style=style.default_style)
-        line.append(_choice_label(value, label), style="white")
-        console.print(line)
+        if idx > 1:
+            body.append("\n")
+
+        body.append(f"  {idx}) ", style=index_style)
+        body.append(_choice_label(value, label), style="white")
 
     if question.multiselect:
-        console.print(
-            Text(
-                "  Enter comma-separated numbers or values",
-                style=style.menu.instruction_style,
-            )
+        body.append(
+            "\n  Enter comma-separated numbers or values", style=style.menu.instruction_style
         )
 
     if default_list:
-        console.print(
-            Text(
-                "  default: "
-                + ", ".join(
-                    _choice_label(value, mapping.get(value, value)) for value in default_list
-                ),
-                style=style.default_style,
-            )
+        defaults = ", ".join(
+            _choice_label(value, mapping.get(value, value)) for value in default_list
         )
+        body.append(f"\n  default: {defaults}", style=style.default_style)
+
+    console.print(body)
 
 
 def _fallback_lookup_maps(
     choices: Sequence[Choice],
 ) -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
-    value_map = {value.lower(): value for value, _ in choices}
-    label_map = {label.lower(): value for value, label in choices}
-    index_map = {str(idx): value for idx, (value, _) in enumerate(choices, start=1)}
+    value_map: dict[str, str] = {}
+    label_map: dict[str, str] = {}
+    index_map: dict[str, str] = {}
+    for idx, (value, label) in enumerate(choices, start=1):
+        value_map[value.lower()] = value
+        label_map[(value if label is None else label).lower()] = value
+        index_map[str(idx)] = value
 
     return value_map, label_map, index_map
 
@@ -735,6 +835,8 @@ def _print_text_summary(value: str, style: Style) -> None:
 
 
 def _highlight_prompt_line(value: str, style: Style) -> None:
+    from rich.control import Control, ControlType
+
     styled = Text(f"{style.input_prefix} {value}", style=style.summary.selected_style)
     controls = (
         Control((ControlType.CURSOR_UP, 1)),
@@ -748,7 +850,7 @@ def _highlight_prompt_line(value: str, style: Style) -> None:
 @dataclass
 class DefaultPlaceholderBindings:
     default_text: str
-    keybind: KeyBindings = field(default_factory=KeyBindings, init=False)
+    keybind: KeyBindings = field(default_factory=_new_key_bindings, init=False)
 
     def build(self) -> KeyBindings:
         self._bind_action(("left",), self._move_left)
@@ -817,6 +919,20 @@ class DefaultPlaceholderBindings:
                 _action(event.app.current_buffer)
 
 
+def _text_prompt_session() -> PromptSession[str]:
+    from prompt_toolkit.application import get_app_session
+
+    return _app_text_prompt_session(get_app_session())
+
+
+@lru_cache(maxsize=1)
+def _app_text_prompt_session(_app_session: AppSession) -> PromptSession[str]:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import DummyHistory
+
+    return PromptSession(history=DummyHistory())
+
+
 def _placeholder_key_bindings(default_text: str) -> KeyBindings:
     return DefaultPlaceholderBindings(default_text).build()
 
@@ -851,11 +967,20 @@ def _choice_label(value: str, label: str | None) -> str:
 
 def supports_live_interaction() -> bool:
     """Return whether both stdin and stdout are attached to a TTY."""
-    return sys.stdin.isatty() and sys.stdout.isatty()
+    return _streams_are_ttys(sys.stdin, sys.stdout)
+
+
+@lru_cache(maxsize=8)
+def _streams_are_ttys(stdin: TextIO, stdout: TextIO) -> bool:
+    return stdin.isatty() and stdout.isatty()
 
 
 def _print_error(message: str | BaseException, style: Style) -> None:
-    console.print(f"[{style.error.style}]{style.error.label}[/] {message}")
+    console.print(Text.assemble((style.error.label, style.error.style), f" {message}"))
+
+
+def _input_prompt(style: Style) -> Text:
+    return Text(f"{style.input_prefix} ", style="bold green")
 
 
 __all__ = [
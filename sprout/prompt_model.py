@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+from collections import ChainMap
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TypeGuard
@@ -15,14 +16,15 @@ type Choice = tuple[str, str]
 class ResolvedPrompt:
     question: Question
     default_value: DefaultValue
-    choices: list[Choice]
+    choices: tuple[Choice, ...]
 
     @classmethod
     def from_question(cls, question: Question, answers: AnswerMap) -> ResolvedPrompt:
+        choices = question.choices(answers) if callable(question.choices) else question.choices
         return cls(
             question=question,
             default_value=question.resolve_default(answers),
-            choices=list(question.resolve_choices(answers) or ()),
+            choices=choices if isinstance(choices, tuple) else tuple(choices or ()),
         )
 
     @property
@@ -46,6 +48,9 @@ class AnswerProcessor:
         raw: str | None = None,
         validator_raw: str | None = None,
     ) -> DefaultValue:
+        if self.question.parser is None and not self.question.validators:
+            return value
+
         processed = self.parse(value, raw=raw)
         self.validate(processed, raw=validator_raw if validator_raw is not None else raw)
 
@@ -99,11 +104,12 @@ def apply_parser(
     answers: AnswerMap,
     raw: str | None = None,
 ) -> DefaultValue:
-    if question.parser and not question.multiselect:
-        raw_value = raw if raw is not None else str(value)
-        return question.parser(raw_value, answers)
+    parser = question.parser
+    if parser is None or question.multiselect:
+        return value
 
-    return value
+    raw_value = raw if raw is not None else str(value)
+    return parser(raw_value, answers)
 
 
 def run_validator(
@@ -115,8 +121,7 @@ def run_validator(
     if not question.validators:
         return
 
-    candidate_answers = dict(answers)
-    candidate_answers[question.key] = value
+    candidate_answers = ChainMap({question.key: value}, answers)
     raw_value = raw if raw is not None else str(value)
 
     for validator in question.validators:
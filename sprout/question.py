@@ -42,7 +42,7 @@ def parse_yes_no(value: str, _answers: AnswerMap) -> bool:
     raise ValueError("expected yes or no.")
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     """
     Define one prompt and its answer-processing rules.
@@ -54,7 +54,7 @@ class Question:
         default (DefaultValue | DefaultFactory): Default answer value or callable that derives one
             from previously collected answers. Defaults to None.
         choices (ChoicesType): Optional static or dynamic list of `(value, label)` choices.
-            Defaults to None.
+            Static choices are stored as a tuple. Defaults to None.
         when (WhenType): Boolean or callable gate that controls whether to ask this question.
             Defaults to True.
         multiselect (bool): Whether this question accepts multiple selected values.
@@ -75,6 +75,10 @@ class Question:
     parser: ParserType | None = None
     validators: Sequence[ValidatorType] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if self.choices is not None and not callable(self.choices):
+            self.choices = tuple(self.choices)
+
     def resolve_default(self, answers: AnswerMap) -> DefaultValue:
         """
         Resolve and return the default value for this question.
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptStyle:
     """Configure prompt header rendering."""
 
@@ -13,7 +13,7 @@ class PromptStyle:
     help_style: str = "dim"
 
 
-@dataclass
+@dataclass(slots=True)
 class InlineStyle:
     """Configure inline two-choice rendering."""
 
@@ -29,7 +29,7 @@ class InlineStyle:
     instruction_style: str = "dim"
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuStyle:
     """Configure vertical menu rendering for multi-choice prompts."""
 
@@ -46,7 +46,7 @@ class MenuStyle:
     instruction_style: str = "dim"
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryStyle:
     """Configure answer summary rendering."""
 
@@ -55,7 +55,7 @@ class SummaryStyle:
     dim_style: str = "dim"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorStyle:
     """Configure validation error rendering."""
 
@@ -63,7 +63,7 @@ class ErrorStyle:
     style: str = "bold red"
 
 
-@dataclass
+@dataclass(slots=True)
 class Style:
     """Aggregate all prompt rendering styles."""
 
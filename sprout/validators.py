@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
+import string
 from collections.abc import Callable, Mapping
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from sprout.project.validators import (
@@ -21,7 +23,11 @@ ValidatorFn = Callable[[str], ValidationResult]
 ContextValidatorFn = Callable[[str, ValidatorAnswers], ValidationResult]
 ValidatorType = ValidatorFn | ContextValidatorFn
 
-SSH_URL_PATTERN = re.compile(r"^git@[\w.-]+:[\w./-]+$")
+# Unused here since _is_ssh_url accepts the same URLs; kept for code that imports it.
+SSH_URL_PATTERN = re.compile(r"^git@[\w.-]+:[\w./-]+$", re.ASCII)
+_URL_SCHEME_PREFIXES = ("http://", "https://", "ssh://")
+_SSH_HOST_CHARACTERS = frozenset(string.ascii_letters + string.digits + "_.-")
+_SSH_PATH_CHARACTERS = _SSH_HOST_CHARACTERS | {"/"}
 
 
 def validate_repository_url(
@@ -36,20 +42,35 @@ def validate_repository_url(
         _answers (ValidatorAnswers | None): Optional answers map for interface compatibility.
             This parameter is unused.
     """
-    url = value.strip()
-    if not url:
-        return True, None
+    return _validate_repository_url_cached(value.strip())
 
-    if SSH_URL_PATTERN.fullmatch(url):
-        return True, None
 
-    parsed = urlparse(url)
-    if parsed.scheme in {"http", "https", "ssh"} and parsed.netloc and parsed.path:
+@lru_cache(maxsize=256)
+def _validate_repository_url_cached(url: str) -> tuple[bool, str | None]:
+    if not url:
         return True, None
 
+    if url.startswith("git@"):
+        if _is_ssh_url(url):
+            return True, None
+    elif url[:8].lower().startswith(_URL_SCHEME_PREFIXES):
+        parsed = urlparse(url)
+        if parsed.netloc and parsed.path:
+            return True, None
+
     return False, "Repository URL must be an HTTP(S) or git@ SSH URL."
 
 
+def _is_ssh_url(url: str) -> bool:
+    host, separator, path = url[4:].partition(":")
+
+    return (
+        bool(separator and host and path)
+        and _SSH_HOST_CHARACTERS.issuperset(host)
+        and _SSH_PATH_CHARACTERS.issuperset(path)
+    )
+
+
 __all__ = [
     "NPM_PACKAGE_NAME_PATTERN",
     "REPOSITORY_NAME_PATTERN",
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -27,6 +29,26 @@ def test_top_level_help_lists_commands_and_legacy_syntax_is_rejected(
     assert legacy_exit.value.code == 2
 
 
+def test_top_level_help_does_not_import_jinja_or_prompt_toolkit() -> None:
+    script = (
+        "import sys\n"
+        "from sprout.cli import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('jinja2' in sys.modules, 'prompt_toolkit' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "False False"
+
+
 def test_init_creates_scaffold_and_refuses_existing_files(tmp_path: Path) -> None:
     root = tmp_path / "template-source"
 
@@ -167,6 +167,22 @@ def test_load_manifest_module_supports_local_imports(tmp_path: Path) -> None:
     assert str(root) not in sys.path
 
 
+def test_load_manifest_module_supports_relative_imports(tmp_path: Path) -> None:
+    root = tmp_path / "template"
+    root.mkdir()
+    (root / "relative_helper.py").write_text("VALUE = 7\n", encoding="utf-8")
+    manifest_path = root / "sprout.py"
+    manifest_path.write_text(
+        "from .relative_helper import VALUE\nquestions = []\nloaded_value = VALUE\n",
+        encoding="utf-8",
+    )
+
+    module = _load_manifest_module(root, manifest_path)
+
+    assert module.loaded_value == 7
+    assert not [name for name in sys.modules if name.startswith("sprout_template_manifest")]
+
+
 def test_load_manifest_happy_path(make_template: TemplateFactory) -> None:
     template_root = make_template(
         """
@@ -204,3 +220,29 @@ def test_load_manifest_rejects_invalid_apply(make_template: TemplateFactory) ->
 
     with pytest.raises(SystemExit, match=r"apply in sprout\.py must be a callable"):
         _load_manifest(template_root)
+
+
+def test_load_manifest_reuses_manifest_until_sprout_py_changes(
+    make_template: TemplateFactory,
+) -> None:
+    template_root = make_template(
+        """
+        from sprout import Question
+
+        questions = [Question(key="name", prompt="Name")]
+        """
+    )
+
+    manifest = _load_manifest(template_root)
+
+    assert _load_manifest(template_root) is manifest
+
+    (template_root / "sprout.py").write_text(
+        'from sprout import Question\n\nquestions = [Question(key="title", prompt="Title")]\n',
+        encoding="utf-8",
+    )
+    reloaded = _load_manifest(template_root)
+
+    assert reloaded is not manifest
+    assert isinstance(reloaded.questions, list)
+    assert [question.key for question in reloaded.questions] == ["title"]
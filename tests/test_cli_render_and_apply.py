@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import inspect
+import os
 import subprocess
+import time
 from pathlib import Path
 
 import pytest
-from jinja2 import Environment
+from jinja2 import Environment, UndefinedError
 
 from sprout.cli import (
     Manifest,
     ManifestContext,
+    RenderJob,
+    TemplateRenderer,
     TemplateSource,
+    _compile_ignore_patterns,
     _invoke_apply,
+    _merge_ignore_patterns,
     _normalise_created,
     _normalise_git_url,
     _resolve_actual_template_dir,
     _resolve_git_executable,
+    _should_ignore_name,
     ensure_destination,
     execute_manifest,
     render_templates,
+    summarize,
 )
 from sprout.style import Style
 
@@ -74,6 +83,19 @@ def test_render_templates_renders_and_copies(tmp_path: Path) -> None:
     assert Path("plain.txt") in created
 
 
+def test_render_templates_copies_bare_jinja_dotfile(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    (template_dir / "nested").mkdir(parents=True)
+    destination.mkdir()
+    (template_dir / "nested" / ".jinja").write_text("{{ raw }}\n", encoding="utf-8")
+
+    created = render_templates(None, template_dir, destination, {})
+
+    assert created == [Path("nested/.jinja")]
+    assert (destination / "nested" / ".jinja").read_text(encoding="utf-8") == "{{ raw }}\n"
+
+
 def test_render_templates_supports_rendered_paths_and_skip(tmp_path: Path) -> None:
     template_dir = tmp_path / "template"
     destination = tmp_path / "out"
@@ -109,6 +131,84 @@ def test_render_templates_supports_rendered_paths_and_skip(tmp_path: Path) -> No
     assert Path("demo.txt") in created
 
 
+def test_render_templates_walks_nested_dirs_in_order_and_prunes_ignored(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    for relative in ("b.txt", "a/z.txt", "a/b/c.txt", "a-file.txt", "node_modules/x.txt"):
+        path = template_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative, encoding="utf-8")
+    destination.mkdir()
+
+    created = render_templates(
+        None,
+        template_dir,
+        destination,
+        {},
+        ignore=["node_modules"],
+    )
+
+    assert created == [
+        Path("a/b/c.txt"),
+        Path("a/z.txt"),
+        Path("a-file.txt"),
+        Path("b.txt"),
+    ]
+    assert (destination / "a" / "b" / "c.txt").read_text(encoding="utf-8") == "a/b/c.txt"
+    assert not (destination / "node_modules").exists()
+
+
+def test_render_templates_compiles_each_templated_path_once_per_render(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+    (template_dir / "{{ name }}.txt").write_text("x\n", encoding="utf-8")
+    (template_dir / "plain.txt").write_text("y\n", encoding="utf-8")
+    env = Environment()
+    compiled: list[str] = []
+    from_string = env.from_string
+
+    def tracking_from_string(source: str) -> object:
+        compiled.append(source)
+        return from_string(source)
+
+    monkeypatch.setattr(env, "from_string", tracking_from_string)
+
+    for index in range(2):
+        destination = tmp_path / f"out-{index}"
+        destination.mkdir()
+        created = render_templates(
+            env,
+            template_dir,
+            destination,
+            {"name": f"demo{index}"},
+            render_paths=True,
+        )
+        assert created == [Path("plain.txt"), Path(f"demo{index}.txt")]
+
+    assert compiled == ["{{ name }}.txt", "{{ name }}.txt"]
+
+
+def test_render_templates_renders_paths_with_custom_delimiters(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    (template_dir / "<< package >>").mkdir(parents=True)
+    (template_dir / "<< package >>" / "__init__.py").write_text("", encoding="utf-8")
+    env = Environment(variable_start_string="<<", variable_end_string=">>")
+
+    created = render_templates(
+        env,
+        template_dir,
+        destination,
+        {"package": "demo"},
+        render_paths=True,
+    )
+
+    assert created == [Path("demo/__init__.py")]
+
+
 def test_render_templates_rejects_parent_path_escape(tmp_path: Path) -> None:
     template_dir = tmp_path / "template"
     destination = tmp_path / "out"
@@ -128,6 +228,27 @@ def test_render_templates_rejects_parent_path_escape(tmp_path: Path) -> None:
     assert not (tmp_path / "escape.txt").exists()
 
 
+def test_render_templates_validates_all_files_before_writing(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    template_dir.mkdir()
+    destination.mkdir()
+    (template_dir / "a.txt").write_text("copied\n", encoding="utf-8")
+    (template_dir / "b.txt.jinja").write_text("{{ name }}\n", encoding="utf-8")
+    (template_dir / "{{ name }}.txt.jinja").write_text("x\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit, match="must stay within the destination directory"):
+        render_templates(
+            None,
+            template_dir,
+            destination,
+            {"name": "../escape"},
+            render_paths=True,
+        )
+
+    assert list(destination.iterdir()) == []
+
+
 def test_render_templates_rejects_absolute_rendered_path(tmp_path: Path) -> None:
     template_dir = tmp_path / "template"
     destination = tmp_path / "out"
@@ -168,6 +289,61 @@ def test_invoke_apply_uses_manifest_context_and_normalises_result(tmp_path: Path
     assert result == [tmp_path / "README.md"]
 
 
+def test_invoke_apply_inspects_hook_signature_once(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    signature_calls: list[object] = []
+    signature = inspect.signature
+
+    def tracking_signature(fn: object) -> inspect.Signature:
+        signature_calls.append(fn)
+        return signature(fn)
+
+    monkeypatch.setattr("sprout.cli.inspect.signature", tracking_signature)
+    context = ManifestContext(
+        env=Environment(),
+        template_dir=tmp_path,
+        template_root=tmp_path,
+        destination=tmp_path,
+        answers={},
+        style=Style(),
+    )
+
+    def apply_fn(context: ManifestContext) -> None:
+        del context
+
+    class ApplyHook:
+        def __call__(self, context: ManifestContext) -> None:
+            del context
+
+    apply_hook = ApplyHook()
+    _invoke_apply(apply_fn, context=context)
+    _invoke_apply(apply_fn, context=context)
+    _invoke_apply(apply_hook, context=context)
+    _invoke_apply(apply_hook, context=context)
+
+    assert signature_calls == [apply_hook]
+
+
+def test_invoke_apply_rejects_context_with_default(tmp_path: Path) -> None:
+    def apply_fn(context: ManifestContext | None = None) -> None:
+        del context
+
+    with pytest.raises(SystemExit, match="must accept exactly one parameter: context"):
+        _invoke_apply(
+            apply_fn,
+            context=ManifestContext(
+                env=Environment(),
+                template_dir=tmp_path,
+                template_root=tmp_path,
+                destination=tmp_path,
+                answers={},
+                style=Style(),
+            ),
+        )
+
+
 def test_invoke_apply_rejects_invalid_return_type(tmp_path: Path) -> None:
     with pytest.raises(SystemExit, match="must return None, a path, or a sequence"):
         _invoke_apply(
@@ -243,8 +419,9 @@ def test_normalise_created_and_template_dir_resolution(tmp_path: Path) -> None:
     absolute = destination / "README.md"
     absolute.write_text("x", encoding="utf-8")
 
-    created = _normalise_created([absolute, "docs/info.md"], destination)
-    assert created == [Path("README.md"), Path("docs/info.md")]
+    outside = tmp_path / "elsewhere.md"
+    created = _normalise_created([absolute, "docs/info.md", outside], destination)
+    assert created == [Path("README.md"), Path("docs/info.md"), outside]
 
     root = tmp_path / "source"
     root.mkdir()
@@ -333,6 +510,52 @@ def test_template_source_remote_success(monkeypatch: pytest.MonkeyPatch, tmp_pat
     assert cleanup_calls == [str(created_temp)]
 
 
+def test_template_source_remote_clones_shallow_without_terminal_prompt(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    class FakeTemporaryDirectory:
+        def __init__(self, prefix: str) -> None:
+            self.name = str(tmp_path)
+
+        def cleanup(self) -> None:
+            pass
+
+    monkeypatch.setattr("sprout.cli._resolve_git_executable", lambda: "git")
+    monkeypatch.setattr("sprout.cli.tempfile.TemporaryDirectory", FakeTemporaryDirectory)
+
+    calls: list[list[str]] = []
+    prompts: list[str | None] = []
+
+    def fake_run(
+        args: list[str],
+        *,
+        env: dict[str, str],
+        **_kwargs: object,
+    ) -> subprocess.CompletedProcess[str]:
+        calls.append(args)
+        prompts.append(env.get("GIT_TERMINAL_PROMPT"))
+        return subprocess.CompletedProcess(args, 0, "", "")
+
+    monkeypatch.setattr("sprout.cli.subprocess.run", fake_run)
+
+    with TemplateSource.from_source("owner/repo"):
+        pass
+
+    assert calls == [
+        [
+            "git",
+            "clone",
+            "--depth",
+            "1",
+            "--",
+            "https://github.com/owner/repo.git",
+            str(tmp_path / "template"),
+        ]
+    ]
+    assert prompts == ["0"]
+
+
 def test_resolve_git_executable_and_url_normalisation(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("sprout.cli.shutil.which", lambda _name: None)
 
@@ -343,3 +566,196 @@ def test_resolve_git_executable_and_url_normalisation(monkeypatch: pytest.Monkey
     assert _normalise_git_url("https://example.com/repo.git") == "https://example.com/repo.git"
     assert _normalise_git_url("owner/repo.git") == "https://github.com/owner/repo.git"
     assert _normalise_git_url("local/path with space") == "local/path with space"
+    assert _normalise_git_url("owner/") == "owner/"
+    assert _normalise_git_url("a/b/c") == "a/b/c"
+
+
+def test_render_templates_copies_assets_with_mode_and_mtime(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    template_dir.mkdir()
+    destination.mkdir()
+    script = template_dir / "run.sh"
+    script.write_bytes(b"#!/bin/sh\necho hi\n")
+    script.chmod(0o755)
+    os.utime(script, ns=(1_000_000_000, 2_000_000_000))
+
+    render_templates(None, template_dir, destination, {})
+
+    copied = destination / "run.sh"
+    assert copied.read_bytes() == b"#!/bin/sh\necho hi\n"
+    assert copied.stat().st_mode & 0o777 == 0o755
+    assert copied.stat().st_mtime_ns == 2_000_000_000
+
+
+def test_render_templates_falls_back_when_copy_file_range_stalls(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    template_dir.mkdir()
+    destination.mkdir()
+    (template_dir / "logo.bin").write_bytes(b"x" * 64)
+    monkeypatch.setattr("sprout.cli.sys.platform", "linux")
+    monkeypatch.setattr("sprout.cli.os.copy_file_range", lambda *_args: 0, raising=False)
+
+    render_templates(None, template_dir, destination, {})
+
+    assert (destination / "logo.bin").read_bytes() == b"x" * 64
+
+
+def test_compile_ignore_patterns_matches_default_and_custom_globs() -> None:
+    ignore_regex = _compile_ignore_patterns(_merge_ignore_patterns(["*.log", "build"]))
+
+    for name in ("__pycache__", "module.pyc", "notes.txt~", ".DS_Store", "debug.log", "build"):
+        assert _should_ignore_name(name, ignore_regex)
+
+    for name in ("README.md", "build.py", "log.txt", "pycache"):
+        assert not _should_ignore_name(name, ignore_regex)
+
+
+def test_render_templates_streams_large_templates(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    template_dir.mkdir()
+    destination.mkdir()
+    (template_dir / "rows.sql.jinja").write_text(
+        "{% for row in range(count) %}INSERT {{ row }} {{ name }};\n{% endfor %}",
+        encoding="utf-8",
+    )
+
+    render_templates(None, template_dir, destination, {"name": "x", "count": 1000})
+
+    expected = "".join(f"INSERT {row} x;\n" for row in range(1000))
+    assert (destination / "rows.sql").read_text(encoding="utf-8") == expected
+
+
+def test_render_templates_stops_queued_jobs_after_failure(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    template_dir.mkdir()
+    destination.mkdir()
+    (template_dir / "a.txt.jinja").write_text("{{ missing() }}", encoding="utf-8")
+    for index in range(20):
+        (template_dir / f"static{index:02}.txt").write_text("static\n", encoding="utf-8")
+
+    copied: list[str] = []
+
+    def slow_copy(source: Path, _target: Path) -> None:
+        time.sleep(0.05)
+        copied.append(source.name)
+
+    monkeypatch.setattr("sprout.cli.MAX_RENDER_WORKERS", 1)
+    monkeypatch.setattr("sprout.cli._fastcopy", slow_copy)
+
+    with pytest.raises(UndefinedError):
+        render_templates(None, template_dir, destination, {})
+
+    assert len(copied) < 20
+
+
+def test_render_templates_writes_colliding_targets_once_with_last_source(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    template_dir.mkdir()
+    destination.mkdir()
+    (template_dir / "x.txt").write_text("static\n" * 1000, encoding="utf-8")
+    (template_dir / "x.txt.jinja").write_text("{{ name }}\n", encoding="utf-8")
+    (template_dir / "y.txt").write_text("y\n", encoding="utf-8")
+
+    written: list[str] = []
+    render_job = TemplateRenderer._render_job
+
+    def record(renderer: TemplateRenderer, job: RenderJob) -> None:
+        written.append(Path(job.source).name)
+        render_job(renderer, job)
+
+    monkeypatch.setattr(TemplateRenderer, "_render_job", record)
+
+    created = render_templates(None, template_dir, destination, {"name": "rendered"})
+
+    assert created == [Path("x.txt"), Path("x.txt"), Path("y.txt")]
+    assert sorted(written) == ["x.txt.jinja", "y.txt"]
+    assert (destination / "x.txt").read_text(encoding="utf-8") == "rendered\n"
+
+
+def test_render_templates_renders_many_files_in_walk_order(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    destination.mkdir()
+    expected: list[Path] = []
+    for index in range(40):
+        directory = template_dir / f"pkg{index % 4}"
+        directory.mkdir(parents=True, exist_ok=True)
+        if index % 2:
+            (directory / f"file{index:02}.txt.jinja").write_text("{{ name }}\n", encoding="utf-8")
+        else:
+            (directory / f"file{index:02}.txt").write_text("static\n", encoding="utf-8")
+        expected.append(Path(f"pkg{index % 4}") / f"file{index:02}.txt")
+
+    created = render_templates(None, template_dir, destination, {"name": "Sprout"})
+
+    assert created == sorted(expected)
+    for index, path in enumerate(sorted(expected, key=lambda item: item.name)):
+        content = "Sprout\n" if index % 2 else "static\n"
+        assert (destination / path).read_text(encoding="utf-8") == content
+
+
+def test_render_templates_creates_each_parent_directory_once(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    template_dir = tmp_path / "template"
+    destination = tmp_path / "out"
+    destination.mkdir()
+    for relative in ("top.txt", "docs/a.txt", "docs/b.txt", "docs/api/c.txt"):
+        path = template_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative, encoding="utf-8")
+
+    mkdir_calls: list[Path] = []
+    mkdir = Path.mkdir
+
+    def tracking_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+        mkdir_calls.append(self)
+        mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", tracking_mkdir)
+
+    created = render_templates(None, template_dir, destination, {})
+
+    assert created == [
+        Path("docs/a.txt"),
+        Path("docs/api/c.txt"),
+        Path("docs/b.txt"),
+        Path("top.txt"),
+    ]
+    assert mkdir_calls == [destination / "docs", destination / "docs" / "api"]
+    assert (destination / "top.txt").read_text(encoding="utf-8") == "top.txt"
+
+
+def test_summarize_prints_heading_and_paths_as_plain_lines(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    summarize([Path("a.txt"), Path("docs/b.md")], Path("/dest"))
+
+    assert capsys.readouterr().out == "\nGenerated files in /dest\n  • a.txt\n  • docs/b.md\n"
+
+
+def test_summarize_prints_through_console_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    printed: list[object] = []
+    monkeypatch.setattr(
+        "sprout.cli.console.print",
+        lambda *objects, **_kwargs: printed.extend(objects),
+    )
+
+    summarize([Path("a.txt")], Path("/dest"))
+
+    assert [str(item) for item in printed] == ["\nGenerated files in /dest\n  • a.txt"]
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 import datetime as dt
+import importlib.util
+import os
 from pathlib import Path
 
 import pytest
 from jinja2 import Environment
 from jinja2.ext import Extension
 
-from sprout.extensions import CurrentYearExtension, GitDefaultsExtension, build_environment
+from sprout.extensions import (
+    CurrentYearExtension,
+    GitDefaultsExtension,
+    _bytecode_cache_pattern,
+    _get_environment,
+    build_environment,
+)
 
 
 class MarkerExtension(Extension):
@@ -31,6 +39,204 @@ def test_build_environment_applies_extensions_once(tmp_path: Path) -> None:
     assert MarkerExtension.calls == 1
 
 
+def test_build_environment_writes_bytecode_cache(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    cache_dir = tmp_path / "cache" / "jinja"
+    template_dir.mkdir()
+    (template_dir / "README.md.jinja").write_text("Hello {{ name }}\n", encoding="utf-8")
+
+    env = build_environment(
+        template_dir, extensions=[MarkerExtension], bytecode_cache_dir=cache_dir
+    )
+
+    assert env.get_template("README.md.jinja").render(name="Sprout") == "Hello Sprout\n"
+    assert env.auto_reload is False
+    assert [path.suffix for path in cache_dir.iterdir()] == [".cache"]
+
+
+def test_build_environment_separates_bytecode_cache_by_settings(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    cache_dir = tmp_path / "cache"
+    template_dir.mkdir()
+    (template_dir / "x.html.jinja").write_text("hi {{ value }}\n", encoding="utf-8")
+
+    plain = build_environment(
+        template_dir,
+        extensions=[MarkerExtension],
+        keep_trailing_newline=True,
+        bytecode_cache_dir=cache_dir,
+    )
+    escaped = build_environment(
+        template_dir,
+        extensions=[MarkerExtension],
+        autoescape=True,
+        keep_trailing_newline=False,
+        bytecode_cache_dir=cache_dir,
+    )
+
+    assert plain.get_template("x.html.jinja").render(value="<b>") == "hi <b>\n"
+    assert escaped.get_template("x.html.jinja").render(value="<b>") == "hi &lt;b&gt;"
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_build_environment_renders_without_unusable_default_cache_dir(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+    (template_dir / "README.md.jinja").write_text("Hello {{ name }}\n", encoding="utf-8")
+    temp_root = tmp_path / "tmp"
+    temp_root.mkdir()
+    (temp_root / f"_jinja2-cache-{os.getuid()}").symlink_to(tmp_path / "missing")
+    monkeypatch.setattr("jinja2.bccache.tempfile.gettempdir", lambda: str(temp_root))
+
+    env = build_environment(template_dir, extensions=[MarkerExtension])
+
+    assert env.bytecode_cache is None
+    assert env.get_template("README.md.jinja").render(name="Sprout") == "Hello Sprout\n"
+
+
+def test_build_environment_ignores_unwritable_bytecode_cache(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+    (template_dir / "README.md.jinja").write_text("Hello {{ name }}\n", encoding="utf-8")
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+
+    unusable = build_environment(
+        template_dir, extensions=[MarkerExtension], bytecode_cache_dir=blocker / "cache"
+    )
+    cache_dir = tmp_path / "cache"
+    readonly = build_environment(
+        template_dir, extensions=[MarkerExtension], bytecode_cache_dir=cache_dir
+    )
+    cache_dir.rmdir()
+    cache_dir.write_text("", encoding="utf-8")
+
+    assert unusable.bytecode_cache is None
+    assert unusable.get_template("README.md.jinja").render(name="a") == "Hello a\n"
+    assert readonly.get_template("README.md.jinja").render(name="b") == "Hello b\n"
+
+
+def _load_extension(module_path: Path) -> type[Extension]:
+    spec = importlib.util.spec_from_file_location("sprout_template_manifest", module_path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module.LocalExtension
+
+
+def test_bytecode_cache_pattern_tracks_extension_source_changes(tmp_path: Path) -> None:
+    module_path = tmp_path / "sprout.py"
+    module_path.write_text(
+        "from jinja2.ext import Extension\n\n"
+        "class LocalExtension(Extension):\n"
+        "    def parse(self, parser):\n"
+        "        return []\n",
+        encoding="utf-8",
+    )
+    first = _bytecode_cache_pattern(
+        [_load_extension(module_path)], autoescape=False, keep_trailing_newline=True
+    )
+
+    module_path.write_text(
+        module_path.read_text(encoding="utf-8").replace("[]", "None"), encoding="utf-8"
+    )
+    stat_result = module_path.stat()
+    os.utime(module_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+    second = _bytecode_cache_pattern(
+        [_load_extension(module_path)], autoescape=False, keep_trailing_newline=True
+    )
+
+    assert first is not None
+    assert second is not None
+    assert first != second
+
+
+def test_build_environment_skips_bytecode_cache_for_sourceless_extension(tmp_path: Path) -> None:
+    namespace: dict[str, object] = {}
+    exec(
+        "from jinja2.ext import Extension\n"
+        "class GeneratedExtension(Extension):\n"
+        "    def parse(self, parser):\n"
+        "        return []\n",
+        namespace,
+    )
+    extension = namespace["GeneratedExtension"]
+    assert isinstance(extension, type)
+    assert issubclass(extension, Extension)
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+
+    env = build_environment(
+        template_dir, extensions=[extension], bytecode_cache_dir=tmp_path / "cache"
+    )
+
+    assert env.bytecode_cache is None
+
+
+def test_get_environment_reuses_environment_per_template_dir(tmp_path: Path) -> None:
+    MarkerExtension.calls = 0
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+    first_dir.mkdir()
+    second_dir.mkdir()
+
+    env = _get_environment(first_dir, [MarkerExtension])
+
+    assert _get_environment(tmp_path / "." / "first", (MarkerExtension,)) is env
+    assert _get_environment(second_dir, [MarkerExtension]) is not env
+    assert _get_environment(first_dir, [CurrentYearExtension]) is not env
+    assert MarkerExtension.calls == 2
+
+
+def test_get_environment_refreshes_git_defaults_per_call(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setattr("sprout.extensions.Path.home", lambda: home)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(home / ".config"))
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+
+    for name in ("Alice", "Bob"):
+        repo = tmp_path / name.lower()
+        (repo / ".git").mkdir(parents=True)
+        (repo / ".git" / "config").write_text(f"[user]\nname = {name}\n", encoding="utf-8")
+
+    monkeypatch.chdir(tmp_path / "alice")
+    env = _get_environment(template_dir, [GitDefaultsExtension])
+    assert env.globals["git_user_name"] == "Alice"
+
+    monkeypatch.chdir(tmp_path / "bob")
+    assert _get_environment(template_dir, [GitDefaultsExtension]) is env
+    assert env.globals["git_user_name"] == "Bob"
+
+
+def test_get_environment_reloads_edited_templates(tmp_path: Path) -> None:
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+    template = template_dir / "README.md.jinja"
+    template.write_text("v1", encoding="utf-8")
+
+    env = _get_environment(template_dir, [MarkerExtension])
+    assert env.get_template("README.md.jinja").render() == "v1"
+
+    template.write_text("v2 edited", encoding="utf-8")
+    stat_result = template.stat()
+    os.utime(template, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+    assert (
+        _get_environment(template_dir, [MarkerExtension]).get_template("README.md.jinja").render()
+        == "v2 edited"
+    )
+
+
 def test_current_year_extension_sets_utc_year() -> None:
     env = Environment()
     CurrentYearExtension(env)
@@ -175,3 +381,35 @@ def test_get_github_username_falls_back_to_user_name(monkeypatch: pytest.MonkeyP
     monkeypatch.setattr(extension, "_get_git_config", lambda _key: "fallback-user")
 
     assert extension._get_github_username() == "fallback-user"
+
+
+def test_get_github_username_prefers_origin_remote(tmp_path: Path) -> None:
+    config = tmp_path / "config"
+    config.write_text(
+        '[remote "fork"]\nurl = git@github.com:someone/sprout.git\n'
+        '[remote "origin"]\nurl = https://github.com/zigai/sprout.git\n',
+        encoding="utf-8",
+    )
+
+    extension = object.__new__(GitDefaultsExtension)
+    extension._repo_config_path = config
+
+    assert extension._get_github_username() == "zigai"
+
+
+def test_load_config_reuses_parsed_config_until_file_changes(tmp_path: Path) -> None:
+    config = tmp_path / "config"
+    config.write_text("[user]\nname = Alice\n", encoding="utf-8")
+    extension = object.__new__(GitDefaultsExtension)
+
+    first = extension._load_config(config)
+
+    assert first is not None
+    assert extension._load_config(config) is first
+
+    config.write_text("[user]\nname = Alice Smith\n", encoding="utf-8")
+    updated = extension._load_config(config)
+
+    assert updated is not None
+    assert updated.get("user", "name") == "Alice Smith"
+    assert extension._load_config(tmp_path / "missing") is None
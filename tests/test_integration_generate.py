@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -105,3 +107,34 @@ def test_main_supports_apply_hook(make_template: TemplateFactory, tmp_path: Path
     assert exit_code == 0
     assert (destination / "README.md").read_text(encoding="utf-8") == "generated\n"
     assert (destination / "EXTRA.txt").read_text(encoding="utf-8") == "extra\n"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_main_generates_from_cloned_template_importing_subpackage(
+    make_template: TemplateFactory,
+    tmp_path: Path,
+) -> None:
+    template_root = make_template(
+        """
+        from sprout import Question
+
+        from helpers.names import NAME
+
+        questions = [Question(key="name", prompt="Project name", default=NAME)]
+        """,
+        files={
+            "helpers/__init__.py": "",
+            "helpers/names.py": "NAME = 'cloned'\n",
+            "template/README.md.jinja": "name={{ name }}\n",
+        },
+    )
+    git = ["git", "-C", str(template_root), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], check=True)
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "template"], check=True)
+    destination = tmp_path / "generated"
+
+    exit_code = main(["new", template_root.as_uri(), str(destination), "--name", "cloned"])
+
+    assert exit_code == 0
+    assert (destination / "README.md").read_text(encoding="utf-8") == "name=cloned\n"
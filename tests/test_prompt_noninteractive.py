@@ -1,20 +1,37 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
+from pathlib import Path
 
 import pytest
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.keys import Keys
+from prompt_toolkit.output import DummyOutput
 
 from sprout.prompt import (
+    _CHOICE_MENU_STATES,
+    ChoiceMenuState,
     DefaultPlaceholderBindings,
     FallbackChoicePrompt,
     QuestionPrompt,
     _apply_cli_answer,
     _apply_parser,
     _as_choice_values,
+    _choice_key_bindings,
+    _confirm_yn,
     _fallback_default_values,
     _fallback_lookup_maps,
+    _inline_pt_style,
+    _menu_pt_style,
+    _print_error,
+    _print_fallback_choices,
     _run_validator,
+    _text_prompt_session,
+    confirm_overwrite,
+    supports_live_interaction,
 )
+from sprout.prompt_model import AnswerProcessor, ResolvedPrompt
 from sprout.question import Question
 from sprout.style import Style
 
@@ -29,6 +46,13 @@ def test_apply_parser_uses_parser_for_single_values() -> None:
     assert _apply_parser(question, "sprout", {}) == "SPROUT"
 
 
+def test_answer_processor_returns_value_untouched_without_parser_or_validators() -> None:
+    value = ["a", "b"]
+    processor = AnswerProcessor(Question(key="tags", prompt="Tags"), {})
+
+    assert processor.process(value, raw="a, b") is value
+
+
 def test_apply_parser_skips_multiselect_parser() -> None:
     question = Question(
         key="tags",
@@ -53,6 +77,22 @@ def test_run_validator_supports_both_signatures() -> None:
     _run_validator(question, "ok", {}, raw="ok")
 
 
+def test_run_validator_overlays_candidate_without_copying_answers() -> None:
+    seen: list[tuple[object, object]] = []
+
+    def record(_raw: str, answers: Mapping[str, object]) -> tuple[bool, str | None]:
+        seen.append((answers["name"], answers["kind"]))
+        return True, None
+
+    answers: dict[str, object] = {"name": "old", "kind": "lib"}
+    question = Question(key="name", prompt="Name", validators=[record])
+
+    _run_validator(question, "new", answers, raw="new")
+
+    assert seen == [("new", "lib")]
+    assert answers == {"name": "old", "kind": "lib"}
+
+
 def test_run_validator_raises_value_error() -> None:
     question = Question(
         key="name",
@@ -78,6 +118,14 @@ def test_run_validator_preserves_validator_type_error() -> None:
         _run_validator(question, "bad", {}, raw="bad")
 
 
+def test_resolved_prompt_reuses_static_choice_tuple() -> None:
+    question = Question(key="kind", prompt="Kind", choices=[("lib", "Library")])
+    dynamic = Question(key="kind", prompt="Kind", choices=lambda _answers: [("app", "App")])
+
+    assert ResolvedPrompt.from_question(question, {}).choices is question.choices
+    assert ResolvedPrompt.from_question(dynamic, {}).choices == (("app", "App"),)
+
+
 def test_apply_cli_answer_validates_single_choices() -> None:
     question = Question(
         key="license",
@@ -126,18 +174,31 @@ def test_fallback_lookup_maps_and_token_resolution() -> None:
         {"tests": "tests", "lint": "lint"},
         {"1": "tests", "2": "lint"},
     )
+    assert _fallback_lookup_maps([("Docs", None)])[1] == {"docs": "Docs"}
 
     prompt = FallbackChoicePrompt(
         question=Question(key="workflow", prompt="Workflow"),
         answers={},
         default_value=None,
         choices=choices,
+        value_to_label=dict(choices),
     )
 
     assert prompt._resolve_token("1") == "tests"
     assert prompt._resolve_token("lint") == "lint"
     assert prompt._resolve_token("Tests") == "tests"
     assert prompt._resolve_token("unknown") is None
+    assert prompt._resolve_multiselect("1, ,LINT,") == ["tests", "lint"]
+
+    empty_value = FallbackChoicePrompt(
+        question=Question(key="workflow", prompt="Workflow"),
+        answers={},
+        default_value=None,
+        choices=[("", "None")],
+        value_to_label={"": "None"},
+    )
+
+    assert empty_value._resolve_token("1") == ""
 
 
 def test_resolve_fallback_choice_uses_default_and_reports_empty(
@@ -155,6 +216,7 @@ def test_resolve_fallback_choice_uses_default_and_reports_empty(
         answers={},
         default_value="mit",
         choices=[("mit", "MIT")],
+        value_to_label={"mit": "MIT"},
         style=style,
     )
     resolved = prompt.resolve_choice("")
@@ -165,6 +227,7 @@ def test_resolve_fallback_choice_uses_default_and_reports_empty(
         answers={},
         default_value=None,
         choices=[("mit", "MIT")],
+        value_to_label={"mit": "MIT"},
         style=style,
     )
     unresolved = prompt_without_default.resolve_choice("")
@@ -272,6 +335,7 @@ def test_fallback_choice_multiselect_retries_on_unknown(
         answers={},
         default_value=[],
         choices=[("tests", "Tests"), ("lint", "Lint")],
+        value_to_label={"tests": "Tests", "lint": "Lint"},
         style=Style(),
     ).ask()
 
@@ -279,3 +343,283 @@ def test_fallback_choice_multiselect_retries_on_unknown(
     assert any("Unknown choice" in error for error in errors)
     assert summaries
     assert summaries[-1] == ["tests", "lint"]
+
+
+def test_print_fallback_choices_renders_one_block(monkeypatch: pytest.MonkeyPatch) -> None:
+    printed: list[object] = []
+    monkeypatch.setattr("sprout.prompt.console.print", printed.append)
+
+    _print_fallback_choices(
+        Question(key="workflows", prompt="Workflows", multiselect=True),
+        [("tests", "Tests"), ("lint", "Lint")],
+        {"tests": "Tests", "lint": "Lint"},
+        ["lint"],
+        Style(),
+    )
+
+    assert len(printed) == 1
+    assert str(printed[0]).splitlines() == [
+        "  1) Tests",
+        "  2) Lint",
+        "  Enter comma-separated numbers or values",
+        "  default: Lint",
+    ]
+
+
+def test_prompt_toolkit_styles_are_cached_per_style_values() -> None:
+    menu_args = ("bold", "dim", "bold ansicyan", "bold", "dim", "bold", "")
+    inline_args = ("bold", "bold cyan", "bold", "dim", "bold", "", "dim")
+
+    assert _menu_pt_style(*menu_args) is _menu_pt_style(*menu_args)
+    assert _inline_pt_style(*inline_args) is _inline_pt_style(*inline_args)
+    assert _menu_pt_style(*menu_args) is not _menu_pt_style("italic", *menu_args[1:])
+
+
+class RecordingApplication:
+    instances: list[RecordingApplication] = []
+
+    def __init__(self, **kwargs: object) -> None:
+        self.layout = kwargs["layout"]
+        RecordingApplication.instances.append(self)
+
+    def run(self) -> None:
+        return None
+
+    def fragments(self) -> list[tuple[str, str]]:
+        return self.layout.container.content.text()
+
+
+def test_choice_menu_render_marks_pointer_and_selection(monkeypatch: pytest.MonkeyPatch) -> None:
+    RecordingApplication.instances = []
+    monkeypatch.setattr("prompt_toolkit.application.Application", RecordingApplication)
+    question = Question(
+        key="workflows",
+        prompt="Workflows",
+        choices=[("tests", "Tests"), ("lint", None), ("docs", "Docs")],
+        multiselect=True,
+    )
+    prompt = QuestionPrompt(question, {}, Style())
+
+    assert prompt._run_choice_application(prompt.resolved.choices, ["lint"]) == ["lint"]
+
+    menu = Style().menu
+    blank = " " * len(menu.caret_icon)
+    assert RecordingApplication.instances[0].fragments() == [
+        ("", blank),
+        ("class:bullet", menu.bullet_unselected_icon),
+        ("class:text", "Tests"),
+        ("", "\n"),
+        ("class:caret", menu.caret_icon),
+        ("class:bullet.sel", menu.bullet_selected_icon),
+        ("class:text.sel", "lint"),
+        ("", "\n"),
+        ("", blank),
+        ("class:bullet", menu.bullet_unselected_icon),
+        ("class:text", "Docs"),
+    ]
+
+
+def test_inline_choice_render_marks_pointer(monkeypatch: pytest.MonkeyPatch) -> None:
+    RecordingApplication.instances = []
+    monkeypatch.setattr("prompt_toolkit.application.Application", RecordingApplication)
+    question = Question(
+        key="license",
+        prompt="License",
+        choices=[("mit", "MIT"), ("apache", "Apache")],
+        default="apache",
+    )
+    prompt = QuestionPrompt(question, {}, Style())
+
+    assert prompt._run_inline_application() == "apache"
+
+    style = Style()
+    assert RecordingApplication.instances[0].fragments() == [
+        ("class:prefix", style.prompt.prefix),
+        ("class:prompt", "License "),
+        ("class:bullet", style.inline.unselected_icon),
+        ("", " "),
+        ("class:text", "MIT"),
+        ("", style.inline.separator),
+        ("class:bullet.sel", style.inline.selected_icon),
+        ("", " "),
+        ("class:text.sel", "Apache"),
+        ("", "  "),
+        ("class:hint", style.inline.instruction),
+    ]
+
+
+def test_inline_preview_marks_default_choice() -> None:
+    question = Question(
+        key="license",
+        prompt="License",
+        choices=[("mit", "MIT"), ("apache", "Apache")],
+        default="apache",
+    )
+
+    assert QuestionPrompt(question, {}, Style())._format_inline_preview() == "○ MIT / ● Apache"
+
+
+def test_supports_live_interaction_checks_each_stream_pair_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    class FakeStream:
+        def __init__(self, name: str, *, tty: bool) -> None:
+            self.name = name
+            self.tty = tty
+
+        def isatty(self) -> bool:
+            calls.append(self.name)
+            return self.tty
+
+    monkeypatch.setattr("sys.stdin", FakeStream("stdin", tty=True))
+    monkeypatch.setattr("sys.stdout", FakeStream("stdout", tty=True))
+
+    assert supports_live_interaction() is True
+    assert supports_live_interaction() is True
+    assert calls == ["stdin", "stdout"]
+
+    monkeypatch.setattr("sys.stdout", FakeStream("piped", tty=False))
+
+    assert supports_live_interaction() is False
+    assert calls == ["stdin", "stdout", "stdin", "piped"]
+
+
+def test_live_text_prompts_reuse_session_without_stale_placeholder(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class FakeSession:
+        def __init__(self) -> None:
+            self.placeholder: str | None = None
+            self.key_bindings: object = None
+            self.seen: list[str | None] = []
+            self.responses = iter(["", "typed"])
+
+        def prompt(self, _message: str, **kwargs: object) -> str:
+            for name, value in kwargs.items():
+                setattr(self, name, value)
+
+            self.seen.append(self.placeholder)
+            return next(self.responses)
+
+    session = FakeSession()
+    monkeypatch.setattr("sprout.prompt.supports_live_interaction", lambda: True)
+    monkeypatch.setattr("sprout.prompt._text_prompt_session", lambda: session)
+    monkeypatch.setattr("sprout.prompt._highlight_prompt_line", lambda *_args: None)
+    monkeypatch.setattr("sprout.prompt.console.print", lambda *_args, **_kwargs: None)
+
+    first = QuestionPrompt(Question(key="name", prompt="Name", default="demo"), {}, Style())
+    second = QuestionPrompt(Question(key="description", prompt="Description"), {}, Style())
+
+    assert first.ask() == "demo"
+    assert second.ask() == "typed"
+    assert session.seen == ["demo", None]
+    assert session.key_bindings is None
+
+
+def test_choice_key_bindings_are_shared_and_read_state_from_the_app() -> None:
+    class FakeApp:
+        def __init__(self) -> None:
+            self.result: object = None
+
+        def invalidate(self) -> None:
+            pass
+
+        def exit(self, *, result: object) -> None:
+            self.result = result
+
+    class FakeEvent:
+        def __init__(self, app: FakeApp) -> None:
+            self.app = app
+
+    bindings = _choice_key_bindings(multiselect=True)
+    assert _choice_key_bindings(multiselect=True) is bindings
+    assert _choice_key_bindings(multiselect=False) is not bindings
+
+    def press(app: FakeApp, key: str) -> None:
+        (binding,) = bindings.get_bindings_for_keys((key,))
+        binding.handler(FakeEvent(app))
+
+    first, second = FakeApp(), FakeApp()
+    items = [("tests", "Tests"), ("lint", "Lint"), ("docs", "Docs")]
+    _CHOICE_MENU_STATES[first] = ChoiceMenuState([0], set(), items, multiselect=True)
+    _CHOICE_MENU_STATES[second] = ChoiceMenuState([2], {0}, items, multiselect=True)
+
+    press(first, "down")
+    press(first, " ")
+    press(first, "end")
+    press(first, " ")
+    press(first, Keys.Enter)
+    press(second, Keys.Enter)
+
+    assert first.result == ["lint", "docs"]
+    assert second.result == ["tests"]
+
+
+def test_print_error_keeps_square_brackets_literal(monkeypatch: pytest.MonkeyPatch) -> None:
+    printed: list[object] = []
+    monkeypatch.setattr("sprout.prompt.console.print", printed.append)
+
+    _print_error("invalid choice(s): [bold]x[/bold]", Style())
+
+    assert [str(item) for item in printed] == ["Error: invalid choice(s): [bold]x[/bold]"]
+
+
+def test_text_prompt_session_follows_the_active_app_session() -> None:
+    with (
+        create_pipe_input() as first_input,
+        create_app_session(input=first_input, output=DummyOutput()),
+    ):
+        first = _text_prompt_session()
+        assert _text_prompt_session() is first
+        assert first.input is first_input
+
+    with (
+        create_pipe_input() as second_input,
+        create_app_session(input=second_input, output=DummyOutput()),
+    ):
+        second = _text_prompt_session()
+
+    assert second is not first
+    assert second.input is second_input
+
+
+def test_confirm_overwrite_returns_default_without_live_terminal(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    def fail_session(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("confirm session should not be created")
+
+    monkeypatch.setattr("prompt_toolkit.shortcuts.create_confirm_session", fail_session)
+    monkeypatch.setattr("sprout.prompt.supports_live_interaction", lambda: False)
+
+    assert confirm_overwrite(tmp_path, style=Style()) is False
+
+
+@pytest.mark.parametrize(
+    ("keys", "default", "expected"),
+    [
+        ("\r", False, False),
+        ("\r", True, True),
+        ("y", False, True),
+        ("N", True, False),
+    ],
+)
+def test_confirm_yn_reads_keys_from_live_session(
+    monkeypatch: pytest.MonkeyPatch,
+    keys: str,
+    default: bool,
+    expected: bool,
+) -> None:
+    monkeypatch.setattr("sprout.prompt.supports_live_interaction", lambda: True)
+
+    with (
+        create_pipe_input() as pipe_input,
+        create_app_session(input=pipe_input, output=DummyOutput()),
+    ):
+        pipe_input.send_text(keys)
+        result = _confirm_yn("Allow overwriting?", default=default, style=Style())
+
+    assert result is expected
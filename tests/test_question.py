@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import fields
+
 import pytest
 
 from sprout.question import YES_NO_CHOICES, Question, parse_yes_no
@@ -74,6 +76,40 @@ def test_question_yes_no_builder_supports_false_default() -> None:
     assert question.resolve_default({}) == "no"
 
 
+def test_resolve_default_calls_factory_with_answers() -> None:
+    question = Question(
+        key="package",
+        prompt="Package name",
+        default=lambda answers: str(answers["name"]).replace("-", "_"),
+    )
+
+    assert question.resolve_default({"name": "my-app"}) == "my_app"
+    assert not hasattr(question, "__dict__")
+    assert [item.name for item in fields(question)][-1] == "validators"
+
+    question.default = lambda answers: f"{answers['name']}-pkg"
+    assert question.resolve_default({"name": "my-app"}) == "my-app-pkg"
+    assert question == Question(key="package", prompt="Package name", default=question.default)
+
+
 def test_parse_yes_no_rejects_invalid_values() -> None:
     with pytest.raises(ValueError, match="expected yes or no"):
         parse_yes_no("maybe", {})
+
+
+def test_question_stores_static_choices_as_tuple() -> None:
+    question = Question(key="kind", prompt="Kind", choices=[("lib", "Library"), ("app", "App")])
+
+    assert question.choices == (("lib", "Library"), ("app", "App"))
+    assert question.resolve_choices({}) == [("lib", "Library"), ("app", "App")]
+
+
+def test_question_keeps_dynamic_choices_callable() -> None:
+    question = Question(
+        key="kind",
+        prompt="Kind",
+        choices=lambda answers: [(str(answers["name"]), "Named")],
+    )
+
+    assert callable(question.choices)
+    assert question.resolve_choices({"name": "demo"}) == [("demo", "Named")]
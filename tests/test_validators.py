@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from sprout.validators import validate_repository_url
+from sprout.validators import SSH_URL_PATTERN, validate_repository_url
 
 
 @pytest.mark.parametrize(
@@ -13,6 +13,9 @@ from sprout.validators import validate_repository_url
         "http://example.com/project",
         "ssh://example.com/repo.git",
         "git@github.com:zigai/sprout.git",
+        "git@my_host.example-1.com:group/sub_group/repo",
+        "HTTPS://github.com/zigai/sprout",
+        "  https://github.com/zigai/sprout  ",
     ],
 )
 def test_validate_repository_url_accepts_supported_forms(value: str) -> None:
@@ -30,6 +33,12 @@ def test_validate_repository_url_accepts_supported_forms(value: str) -> None:
         "https://",
         "git@github.com",
         "github.com/owner/repo",
+        "git@github.com:bad path",
+        "git@:zigai/sprout.git",
+        "git@github.com:",
+        "git@github.com:zigai:sprout",
+        "git@gïthub.com:zigai/sprout",
+        "sshx://example.com/repo",
     ],
 )
 def test_validate_repository_url_rejects_invalid_forms(value: str) -> None:
@@ -37,3 +46,19 @@ def test_validate_repository_url_rejects_invalid_forms(value: str) -> None:
 
     assert valid is False
     assert message == "Repository URL must be an HTTP(S) or git@ SSH URL."
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "git@github.com:zigai/sprout.git",
+        "git@github.com:bad path",
+        "git@:zigai/sprout.git",
+        "git@github.com:zigai:sprout",
+        "git@gïthub.com:zigai/sprout",
+    ],
+)
+def test_validate_repository_url_ssh_scan_matches_ssh_url_pattern(value: str) -> None:
+    valid, _message = validate_repository_url(value)
+
+    assert valid is bool(SSH_URL_PATTERN.fullmatch(value))